@@ -1,17 +1,110 @@
 """HTML slide generation using Messages API."""
 
 import os
+import re
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from anthropic import Anthropic
-from .utils import get_logger, ensure_directory
+from .utils import get_logger, ensure_directory, get_anthropic_client, resolve_model, STATIC_CACHE_CONTROL
 
 logger = get_logger(__name__)
 
+# Static prompt text shared by every slide request (only the theme name varies)
+_VIEWPORT_REQUIREMENTS = """1. Complete HTML5 document with DOCTYPE
+2. Inline CSS styling (no external stylesheets)
+3. **MUST fill entire viewport**: Use width: 100vw; height: 100vh for .slide container
+4. **MUST add**: html, body { margin: 0; padding: 0; width: 100%; height: 100vh; overflow: hidden; }"""
+
+_TITLE_SLIDE_REQUIREMENTS = """
+**Slide Requirements**:
+- Centered layout with large, prominent title
+- Professional and clean design
+
+**Output**: Return ONLY the complete HTML code, no explanations.
+"""
+
+_CONTENT_SLIDE_REQUIREMENTS = """
+**Slide Requirements**:
+- Professional typography and spacing
+- Bullet points should be clearly visible and well-spaced
+
+**Output**: Return ONLY the complete HTML code, no explanations.
+"""
+
+# Per-slide layout instructions, filled with str.format
+_IMAGE_LAYOUT = """**Layout**: Two-column (text left, image right)
+- Left column (50% width): Title and bullet points
+- Right column (50% width): Image
+
+**IMAGE REQUIREMENTS - CRITICAL**:
+- MUST include this exact HTML:
+  <img src="{url}" alt="{alt}" style="width: 100%; height: 100%; object-fit: cover; border-radius: 8px;">
+- Image URL: {url}
+- Image will be loaded by browser when rendering
+- Image container must be 50% width of slide
+- Image should be vertically centered
+"""
+
+_TEXT_LAYOUT = "**Layout**: Full-width text (no image)"
+
+_STREAM_IMAGE_LAYOUT = (
+    "Two-column (text left 50%, image right 50%) with exactly:\n"
+    '  <img src="{url}" alt="{alt}" '
+    'style="width: 100%; height: 100%; object-fit: cover; border-radius: 8px;">'
+)
+
+_STREAM_SLIDE_SPEC = "Slide {i:02d}:\n- Title: {title}\n- Bullet points:\n{bullets}\n- Layout: {layout}"
+
+# Markdown code fence (optionally tagged html) wrapped around a response
+CODE_FENCE_RE = re.compile(r"```(?:html)?(.*?)(?:```|\Z)", re.DOTALL)
+
+# Delimiter the model emits before each slide in single-request mode
+SLIDE_MARKER_RE = re.compile(r"<!--\s*SLIDE\s+(\d+)\s*-->")
+# How far back to rescan so a marker split across chunks is still found
+MARKER_LOOKBACK = 32
+
+# Seconds between Message Batches status checks (doubling up to the max)
+BATCH_POLL_INTERVAL = 10.0
+BATCH_MAX_POLL_INTERVAL = 120.0
+
+# Output budget for single-request mode (per slide, and overall cap)
+STREAM_TOKENS_PER_SLIDE = 4000
+STREAM_MAX_TOKENS = 64000
+
+
+def wait_for_batch(client: Anthropic, batch_id: str, poll_interval: float = BATCH_POLL_INTERVAL) -> None:
+    """Block until a Message Batch has finished processing.
+
+    The wait between status checks doubles after each check, up to
+    BATCH_MAX_POLL_INTERVAL, since batches usually take minutes.
+
+    Args:
+        client: Anthropic client that created the batch
+        batch_id: Batch ID
+        poll_interval: Seconds to wait after the first status check
+    """
+    while True:
+        batch = client.messages.batches.retrieve(batch_id)
+        if batch.processing_status == "ended":
+            counts = batch.request_counts
+            logger.info(f"Batch {batch_id} ended: {counts.succeeded} succeeded, "
+                        f"{counts.errored} errored, {counts.expired} expired")
+            return
+        logger.debug("Batch %s still %s...", batch_id, batch.processing_status)
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, BATCH_MAX_POLL_INTERVAL)
+
 
 class HTMLSlideGenerator:
     """Generates HTML slides using Messages API."""
 
+    # Maximum slide requests in flight at once
+    MAX_CONCURRENT_SLIDES = 10
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -31,31 +124,32 @@ class HTMLSlideGenerator:
         if not self.api_key:
             raise ValueError("API key required. Set CONTENT_ANTHROPIC_API_KEY.")
 
-        self.model = model or os.getenv("CONTENT_MODEL", "claude-haiku-4-5-20251001")
+        self._model = resolve_model(model)
         self.base_url = base_url or os.getenv("CONTENT_ANTHROPIC_BASE_URL")
         self.workspace_dir = Path(workspace_dir)
         ensure_directory(self.workspace_dir)
 
-        # Setup Anthropic client with prompt caching
-        client_kwargs = {
-            "api_key": self.api_key,
-            "default_headers": {
-                "anthropic-beta": "prompt-caching-2024-07-31"
-            }
-        }
-        if self.base_url:
-            client_kwargs["base_url"] = self.base_url
-            logger.info(f"Using custom base URL: {self.base_url}")
-        
-        self.client = Anthropic(**client_kwargs)
-        logger.info("Prompt caching enabled")
-
-        # Load themes
+        # Themes are loaded on first use (see themes_content)
         self.themes_path = Path(__file__).parent / "themes.md"
-        self.themes_content = self._load_themes()
+        self._theme_excerpts: Dict[str, str] = {}
 
         logger.info(f"HTMLSlideGenerator initialized with model: {self.model}")
 
+    @property
+    def model(self) -> str:
+        """Claude model, fixed at construction so prompt cache entries stay valid."""
+        return self._model
+
+    @cached_property
+    def client(self) -> Anthropic:
+        """Anthropic client, created on first API use (shared process-wide)."""
+        return get_anthropic_client(self.api_key, self.base_url)
+
+    @cached_property
+    def themes_content(self) -> str:
+        """Content of themes.md, read once on first access."""
+        return self._load_themes()
+
     def _load_themes(self) -> str:
         """Load themes from themes.md file.
 
@@ -74,7 +168,7 @@ class HTMLSlideGenerator:
     def generate_slides_html(
         self,
         structure: Dict[str, Any],
-        image_data: List[Optional[Dict[str, Any]]],
+        image_data: List[Optional[Dict[str, Any]]] | Future,
         theme: str = "Modern Professional",
         output_dir: Optional[Path] = None
     ) -> List[Path]:
@@ -82,7 +176,10 @@ class HTMLSlideGenerator:
 
         Args:
             structure: Presentation structure with title and slides
-            image_data: List of image metadata dicts {url, width, height, description} (or None)
+            image_data: List of image metadata dicts {url, width, height, description} (or None).
+                        May also be a Future resolving to that list; the title slide is
+                        generated while it resolves, so image fetching overlaps with
+                        the first Claude call.
             theme: Theme name (from themes.md)
             output_dir: Output directory for HTML files (overrides workspace_dir)
 
@@ -95,36 +192,234 @@ class HTMLSlideGenerator:
         logger.info(f"Generating HTML slides with theme: {theme}")
         logger.info(f"Structure: {structure.get('title', 'Untitled')} with {len(structure.get('slides', []))} slides")
 
-        html_files = []
+        slides = structure.get("slides", [])
 
-        # Generate title slide (slide_00.html)
+        # Generate title slide (slide_00.html) on its own first. Its request
+        # writes the shared system prompt to the cache, so the content slides
+        # sent after it read that prefix instead of each creating it.
         logger.info("Generating title slide...")
-        title_slide_path = self._generate_title_slide(
+        title_file = self._generate_title_slide(
             title=structure.get("title", "Presentation"),
             theme=theme,
             output_dir=output_dir
         )
-        html_files.append(title_slide_path)
 
-        # Generate content slides
+        # Content slides need the image URLs
+        if isinstance(image_data, Future):
+            image_data = image_data.result()
+
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_SLIDES) as executor:
+            # Generate content slides concurrently
+            slide_futures = []
+            for i, slide_data in enumerate(slides, 1):
+                logger.info("Generating slide %d/%d: %s...", i, len(slides), slide_data.get('title', ''))
+
+                image_info = image_data[i-1] if i-1 < len(image_data) else None
+
+                slide_futures.append(executor.submit(
+                    self._generate_content_slide,
+                    slide_index=i,
+                    slide_data=slide_data,
+                    image_info=image_info,
+                    theme=theme,
+                    output_dir=output_dir
+                ))
+
+            html_files = [title_file] + [f.result() for f in slide_futures]
+
+        logger.info(f"Generated {len(html_files)} HTML files")
+        return html_files
+
+    def generate_slides_html_stream(
+        self,
+        structure: Dict[str, Any],
+        image_data: List[Optional[Dict[str, Any]]] | Future,
+        theme: str = "Modern Professional",
+        output_dir: Optional[Path] = None
+    ) -> List[Path]:
+        """Generate all slides with one streaming Messages API request.
+
+        The model emits every slide in a single response, each preceded by a
+        ``<!-- SLIDE nn -->`` marker. Slides are written to disk as soon as the
+        next marker (or the end of the stream) arrives, so the theme prompt is
+        sent once and there is a single round-trip instead of one per slide.
+
+        Args:
+            structure: Presentation structure with title and slides
+            image_data: List of image metadata dicts (or a Future resolving to one)
+            theme: Theme name (from themes.md)
+            output_dir: Output directory for HTML files (overrides workspace_dir)
+
+        Returns:
+            List of paths to generated HTML files
+        """
+        output_dir = output_dir or self.workspace_dir
+        ensure_directory(output_dir)
+
+        if isinstance(image_data, Future):
+            image_data = image_data.result()
+
         slides = structure.get("slides", [])
+        logger.info(f"Generating {len(slides) + 1} HTML slides in a single request (theme: {theme})")
+
+        slide_specs = [f"Slide 00 (title slide):\n- Title: {structure.get('title', 'Presentation')}"]
         for i, slide_data in enumerate(slides, 1):
-            logger.info(f"Generating slide {i}/{len(slides)}: {slide_data.get('title', '')}...")
-            
+            bullets = "\n".join(f"  - {b}" for b in slide_data.get("bullet_points", []))
             image_info = image_data[i-1] if i-1 < len(image_data) else None
-            
-            slide_path = self._generate_content_slide(
-                slide_index=i,
-                slide_data=slide_data,
-                image_info=image_info,
-                theme=theme,
-                output_dir=output_dir
+            if image_info and image_info.get("url"):
+                layout = _STREAM_IMAGE_LAYOUT.format(
+                    url=image_info["url"],
+                    alt=image_info.get("description", "Slide image")
+                )
+            else:
+                layout = "Full-width text (no image)"
+            slide_specs.append(_STREAM_SLIDE_SPEC.format(
+                i=i, title=slide_data.get('title', f'Slide {i}'), bullets=bullets, layout=layout
+            ))
+
+        prompt_content = f"""Generate every slide of the presentation below.
+
+**Slides**:
+{chr(10).join(slide_specs)}
+
+**Slide Requirements**:
+- Keep colors and typography consistent across all slides
+- Title slide: centered layout with large, prominent title
+- Content slides: bullet points clearly visible and well-spaced
+
+**Output**: For each slide, in order, write the line <!-- SLIDE nn --> (nn = two-digit slide number)
+followed by the complete HTML document. No explanations, no markdown fences.
+"""
+
+        html_files = []
+        parts: List[str] = []  # chunks streamed since the last slide marker
+        scanned = 0
+
+        def flush(chunk: str) -> None:
+            match = SLIDE_MARKER_RE.match(chunk)
+            if not match:
+                return
+            html_files.append(self._write_slide(
+                self._strip_code_fence(chunk[match.end():].strip()),
+                output_dir / f"slide_{int(match.group(1)):02d}.html"
+            ))
+
+        max_tokens = min(STREAM_TOKENS_PER_SLIDE * (len(slides) + 1), STREAM_MAX_TOKENS)
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=self._get_system_prompt(theme),
+            messages=[{"role": "user", "content": prompt_content}]
+        ) as stream:
+            for text in stream.text_stream:
+                parts.append(text)
+                # Markers sit on their own line, so only rescan once a line completes
+                if "\n" not in text:
+                    continue
+                buffer = "".join(parts)
+                # Every marker after the first closes the slide before it
+                match = SLIDE_MARKER_RE.search(buffer, max(scanned - MARKER_LOOKBACK, 1))
+                while match:
+                    flush(buffer[:match.start()])
+                    buffer = buffer[match.start():]
+                    match = SLIDE_MARKER_RE.search(buffer, 1)
+                parts = [buffer]
+                scanned = len(buffer)
+            final_message = stream.get_final_message()
+
+        if final_message.stop_reason == "max_tokens":
+            # The slide still open when the limit hit is cut off mid-document
+            logger.warning(
+                f"Slide stream hit max_tokens ({max_tokens}) after {len(html_files)} "
+                f"complete slides; dropping the truncated last slide"
             )
-            html_files.append(slide_path)
+        else:
+            flush("".join(parts))
 
         logger.info(f"Generated {len(html_files)} HTML files")
         return html_files
 
+    def generate_slides_html_batch(
+        self,
+        decks: List[Dict[str, Any]],
+        poll_interval: float = BATCH_POLL_INTERVAL
+    ) -> List[List[Path]]:
+        """Generate HTML slides for several decks through the Message Batches API.
+
+        Batched requests are billed at half the normal rate but complete
+        asynchronously (usually within minutes, at most 24 hours), so this is
+        meant for non-interactive work such as theme sweeps or bulk
+        regenerations. Interactive generation should keep using
+        generate_slides_html.
+
+        Args:
+            decks: One dict per deck with keys ``structure``, ``image_data``
+                   (list, may be empty), ``theme`` and ``output_dir``
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            HTML file paths per deck, in the order of ``decks``. Slides whose
+            request failed are omitted and logged.
+        """
+        requests = []
+        targets = {}
+        for d, deck in enumerate(decks):
+            structure = deck["structure"]
+            image_data = deck.get("image_data") or []
+            theme = deck.get("theme", "Modern Professional")
+            output_dir = Path(deck.get("output_dir") or self.workspace_dir / f"deck_{d:02d}")
+            ensure_directory(output_dir)
+
+            prompts = [self._title_slide_prompt(structure.get("title", "Presentation"))]
+            for i, slide_data in enumerate(structure.get("slides", []), 1):
+                image_info = image_data[i-1] if i-1 < len(image_data) else None
+                prompts.append(self._content_slide_prompt(i, slide_data, image_info))
+
+            for i, prompt in enumerate(prompts):
+                custom_id = f"deck{d:02d}-slide{i:02d}"
+                targets[custom_id] = (d, output_dir / f"slide_{i:02d}.html")
+                requests.append({
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": 4000,
+                        "system": self._get_system_prompt(theme),
+                        "messages": [{"role": "user", "content": prompt}]
+                    }
+                })
+
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted batch {batch.id} with {len(requests)} slide requests")
+        wait_for_batch(self.client, batch.id, poll_interval)
+
+        html_files: List[List[Path]] = [[] for _ in decks]
+        for entry in self.client.messages.batches.results(batch.id):
+            d, output_path = targets[entry.custom_id]
+            if entry.result.type != "succeeded":
+                logger.error(f"Batch request {entry.custom_id} {entry.result.type}")
+                continue
+            html_content = self._strip_code_fence(entry.result.message.content[0].text)
+            html_files[d].append(self._write_slide(html_content, output_path))
+
+        for files in html_files:
+            files.sort()
+        return html_files
+
+    def _write_slide(self, html_content: str, output_path: Path) -> Path:
+        """Write one slide's HTML to disk."""
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✓ Generated: %s (%d bytes)", output_path.name, output_path.stat().st_size)
+        return output_path
+
+    @staticmethod
+    def _strip_code_fence(html_content: str) -> str:
+        """Remove markdown code fences the model sometimes wraps HTML in."""
+        match = CODE_FENCE_RE.match(html_content)
+        return match.group(1).strip() if match else html_content
+
     def _generate_title_slide(
         self,
         title: str,
@@ -132,53 +427,15 @@ class HTMLSlideGenerator:
         output_dir: Path
     ) -> Path:
         """Generate HTML for title slide."""
-        # Use structured content with cache_control for theme definitions
-        prompt_content = [
-            {
-                "type": "text",
-                "text": f"""Generate a complete HTML5 document for a presentation title slide.
-
-**Theme**: {theme}
-
-**Theme Definitions**:
-{self._get_theme_excerpt(theme)}""",
-                "cache_control": {"type": "ephemeral"}  # Cache theme definitions
-            },
-            {
-                "type": "text",
-                "text": f"""
-**Content**:
-- Title: {title}
-
-**CRITICAL Requirements**:
-1. Complete HTML5 document with DOCTYPE
-2. Inline CSS styling (no external stylesheets)
-3. **MUST fill entire viewport**: Use width: 100vw; height: 100vh for .slide container
-4. **MUST add**: html, body {{ margin: 0; padding: 0; width: 100%; height: 100vh; overflow: hidden; }}
-5. Use {theme} theme colors and typography
-6. Centered layout with large, prominent title
-7. Professional and clean design
-
-**Output**: Return ONLY the complete HTML code, no explanations.
-"""
-            }
-        ]
-
         response = self.client.messages.create(
             model=self.model,
             max_tokens=4000,
-            messages=[{"role": "user", "content": prompt_content}]
+            system=self._get_system_prompt(theme),
+            messages=[{"role": "user", "content": self._title_slide_prompt(title)}]
         )
 
-        html_content = response.content[0].text
-        
-        # Save to file
-        output_path = output_dir / "slide_00.html"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"✓ Generated: slide_00.html ({output_path.stat().st_size} bytes)")
-        return output_path
+        html_content = self._strip_code_fence(response.content[0].text)
+        return self._write_slide(html_content, output_dir / "slide_00.html")
 
     def _generate_content_slide(
         self,
@@ -189,89 +446,90 @@ class HTMLSlideGenerator:
         output_dir: Path
     ) -> Path:
         """Generate HTML for a content slide."""
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=4000,
+            system=self._get_system_prompt(theme),
+            messages=[{
+                "role": "user",
+                "content": self._content_slide_prompt(slide_index, slide_data, image_info)
+            }]
+        )
+
+        html_content = self._strip_code_fence(response.content[0].text)
+        return self._write_slide(html_content, output_dir / f"slide_{slide_index:02d}.html")
+
+    @staticmethod
+    def _title_slide_prompt(title: str) -> str:
+        """Build the user prompt for the title slide."""
+        return f"""Generate a complete HTML5 document for a presentation title slide.
+
+**Content**:
+- Title: {title}
+{_TITLE_SLIDE_REQUIREMENTS}"""
+
+    @staticmethod
+    def _content_slide_prompt(
+        slide_index: int,
+        slide_data: Dict[str, Any],
+        image_info: Optional[Dict[str, Any]]
+    ) -> str:
+        """Build the user prompt for a content slide."""
         slide_title = slide_data.get("title", f"Slide {slide_index}")
         bullets = slide_data.get("bullet_points", [])
         bullets_text = "\n".join([f"  - {b}" for b in bullets])
 
-        layout_instruction = ""
         if image_info and image_info.get("url"):
-            image_url = image_info["url"]
-            image_alt = image_info.get("description", "Slide image")
-            layout_instruction = f"""**Layout**: Two-column (text left, image right)
-- Left column (50% width): Title and bullet points
-- Right column (50% width): Image
-
-**IMAGE REQUIREMENTS - CRITICAL**:
-- MUST include this exact HTML:
-  <img src="{image_url}" alt="{image_alt}" style="width: 100%; height: 100%; object-fit: cover; border-radius: 8px;">
-- Image URL: {image_url}
-- Image will be loaded by browser when rendering
-- Image container must be 50% width of slide
-- Image should be vertically centered
-"""
+            layout_instruction = _IMAGE_LAYOUT.format(
+                url=image_info["url"],
+                alt=image_info.get("description", "Slide image")
+            )
         else:
-            layout_instruction = "**Layout**: Full-width text (no image)"
+            layout_instruction = _TEXT_LAYOUT
 
-        # Use structured content with cache_control for theme definitions
-        prompt_content = [
-            {
-                "type": "text",
-                "text": f"""Generate a complete HTML5 document for a presentation content slide.
-
-**Theme**: {theme}
+        return f"""Generate a complete HTML5 document for a presentation content slide.
 
-**Theme Definitions**:
-{self._get_theme_excerpt(theme)}""",
-                "cache_control": {"type": "ephemeral"}  # Cache theme definitions
-            },
-            {
-                "type": "text",
-                "text": f"""
 **Content**:
 - Title: {slide_title}
 - Bullet points:
 {bullets_text}
 
 {layout_instruction}
+{_CONTENT_SLIDE_REQUIREMENTS}"""
 
-**CRITICAL Requirements**:
-1. Complete HTML5 document with DOCTYPE
-2. Inline CSS styling (no external stylesheets)
-3. **MUST fill entire viewport**: Use width: 100vw; height: 100vh for .slide container
-4. **MUST add**: html, body {{ margin: 0; padding: 0; width: 100%; height: 100vh; overflow: hidden; }}
-5. Use {theme} theme colors and typography
-6. Professional typography and spacing
-7. Bullet points should be clearly visible and well-spaced
+    def _get_system_prompt(self, theme: str) -> List[Dict[str, Any]]:
+        """Build the system prompt shared by every slide request for a theme.
 
-**Output**: Return ONLY the complete HTML code, no explanations.
-"""
-            }
-        ]
+        Title, content and single-request generations all send this exact
+        block first, so after the first call they read it from the prompt
+        cache instead of paying for the theme definitions again.
+        """
+        return [
+            {
+                "type": "text",
+                "text": f"""You generate complete HTML5 documents for presentation slides.
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=4000,
-            messages=[{"role": "user", "content": prompt_content}]
-        )
+**Theme**: {theme}
 
-        html_content = response.content[0].text
-        
-        # Clean up any markdown artifacts
-        if html_content.startswith("```html"):
-            html_content = html_content.split("```html")[1].split("```")[0].strip()
-        elif html_content.startswith("```"):
-            html_content = html_content.split("```")[1].split("```")[0].strip()
-        
-        # Save to file
-        output_path = output_dir / f"slide_{slide_index:02d}.html"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"✓ Generated: slide_{slide_index:02d}.html ({output_path.stat().st_size} bytes)")
-        return output_path
+**Theme Definitions**:
+{self._get_theme_excerpt(theme)}
+
+**CRITICAL Requirements** (every slide):
+{_VIEWPORT_REQUIREMENTS}
+5. Use {theme} theme colors and typography""",
+                "cache_control": STATIC_CACHE_CONTROL  # Cache theme definitions
+            }
+        ]
 
     def _get_theme_excerpt(self, theme: str) -> str:
-        """Extract relevant theme section from themes.md."""
+        """Extract relevant theme section from themes.md (cached per theme)."""
+        excerpt = self._theme_excerpts.get(theme)
+        if excerpt is None:
+            excerpt = self._theme_excerpts[theme] = self._extract_theme_excerpt(theme)
+        return excerpt
+
+    def _extract_theme_excerpt(self, theme: str) -> str:
+        """Scan themes.md for the given theme's section."""
         lines = self.themes_content.split('\n')
         
         # Find the theme section
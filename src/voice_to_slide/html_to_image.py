@@ -1,16 +1,31 @@
 """Convert HTML to images using Playwright."""
 
 import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Optional
-from playwright.sync_api import sync_playwright, Browser, Page
+from playwright.sync_api import sync_playwright, Browser
 from .utils import get_logger, ensure_directory
 
 logger = get_logger(__name__)
 
 
+# Chromium flags: /dev/shm is tiny in Docker and causes crashes on large pages
+BROWSER_ARGS = ["--disable-dev-shm-usage"]
+
+# Upper bound on parallel render processes (each runs its own Chromium)
+MAX_RENDER_WORKERS = 4
+
+
 class HTMLToImageConverter:
-    """Converts HTML files to PNG images using Playwright."""
+    """Converts HTML files to PNG images using Playwright.
+
+    Use as a context manager to keep one browser alive across several
+    convert_html_to_image() calls; each call then only opens a new context
+    instead of launching Chromium again.
+    """
 
     def __init__(self, headless: bool = True):
         """Initialize converter.
@@ -19,8 +34,37 @@ class HTMLToImageConverter:
             headless: Run browser in headless mode (default: True)
         """
         self.headless = headless
+        self._playwright = None
+        self._browser: Optional[Browser] = None
         logger.info(f"HTMLToImageConverter initialized (headless={headless})")
 
+    def __enter__(self) -> "HTMLToImageConverter":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Launch a browser to be reused by subsequent conversions."""
+        if self._browser is not None:
+            return
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(
+            headless=self.headless,
+            args=BROWSER_ARGS
+        )
+        logger.info("Launched persistent browser")
+
+    def close(self) -> None:
+        """Close the persistent browser, if any."""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
     def convert_html_to_image(
         self,
         html_path: Path,
@@ -43,60 +87,85 @@ class HTMLToImageConverter:
 
         ensure_directory(output_path.parent)
 
+        if self._browser is not None:
+            self._render(self._browser, html_path, output_path, width, height)
+            return output_path
+
         with sync_playwright() as p:
-            # Launch browser
-            browser = p.chromium.launch(headless=self.headless)
-            
-            # Create context with specific viewport size
-            context = browser.new_context(
-                viewport={"width": width, "height": height},
-                device_scale_factor=2  # Retina display for better quality
-            )
-            
-            # Create page
-            page = context.new_page()
-            
+            # No persistent browser: launch one just for this conversion
+            browser = p.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
             try:
-                # Load HTML file (use file:// protocol)
-                html_url = f"file://{html_path.absolute()}"
-                logger.debug(f"Loading: {html_url}")
-                page.goto(html_url, wait_until="networkidle")
-                
-                # Wait for any fonts/resources to load
-                page.wait_for_timeout(1000)  # 1 second
-                
-                # Take screenshot
-                page.screenshot(
-                    path=str(output_path),
-                    full_page=False,  # Exact viewport size
-                    type="png"
-                )
-                
-                logger.info(f"✓ Generated: {output_path.name} ({output_path.stat().st_size} bytes)")
-                
-            except Exception as e:
-                logger.error(f"Failed to convert {html_path}: {e}")
-                raise
-                
+                self._render(browser, html_path, output_path, width, height)
             finally:
                 browser.close()
 
         return output_path
 
+    def _render(
+        self,
+        browser: Browser,
+        html_path: Path,
+        output_path: Path,
+        width: int,
+        height: int
+    ) -> None:
+        """Render one HTML file in a fresh (cheap) browser context."""
+        # Create context with specific viewport size
+        context = browser.new_context(
+            viewport={"width": width, "height": height},
+            device_scale_factor=2  # Retina display for better quality
+        )
+
+        try:
+            # Create page
+            page = context.new_page()
+
+            # Load HTML file (use file:// protocol)
+            html_url = f"file://{html_path.absolute()}"
+            logger.debug("Loading: %s", html_url)
+            page.goto(html_url, wait_until="networkidle")
+
+            # Wait for any fonts/resources to load
+            page.wait_for_timeout(1000)  # 1 second
+
+            # Take screenshot
+            page.screenshot(
+                path=str(output_path),
+                full_page=False,  # Exact viewport size
+                type="png"
+            )
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✓ Generated: %s (%d bytes)", output_path.name, output_path.stat().st_size)
+
+        except Exception as e:
+            logger.error(f"Failed to convert {html_path}: {e}")
+            raise
+
+        finally:
+            context.close()
+
     def convert_html_files_to_images(
         self,
         html_files: List[Path],
         output_dir: Path,
         width: int = 960,
-        height: int = 540
+        height: int = 540,
+        max_workers: Optional[int] = None
     ) -> List[Path]:
         """Convert multiple HTML files to PNG images.
 
+        Without a persistent browser, slides are split across worker processes,
+        each running its own Chromium, so rendering and PNG encoding use
+        several cores.
+
         Args:
             html_files: List of HTML file paths
             output_dir: Output directory for images
             width: Viewport width
             height: Viewport height
+            max_workers: Number of render processes
+                         (default: min(MAX_RENDER_WORKERS, CPU count, number of files))
 
         Returns:
             List of paths to generated PNG images
@@ -104,48 +173,121 @@ class HTMLToImageConverter:
         logger.info(f"Converting {len(html_files)} HTML files to images...")
 
         ensure_directory(output_dir)
-        image_paths = []
 
-        with sync_playwright() as p:
-            # Launch browser once for all conversions
-            browser = p.chromium.launch(headless=self.headless)
-            
-            context = browser.new_context(
-                viewport={"width": width, "height": height},
-                device_scale_factor=2
-            )
-            
-            page = context.new_page()
+        if max_workers is None:
+            max_workers = min(MAX_RENDER_WORKERS, os.cpu_count() or 1, len(html_files))
 
-            try:
-                for html_file in html_files:
-                    # Generate output path
-                    output_path = output_dir / f"{html_file.stem}.png"
-                    
-                    # Load and screenshot
-                    html_url = f"file://{html_file.absolute()}"
-                    page.goto(html_url, wait_until="networkidle")
-                    page.wait_for_timeout(500)  # Wait for fonts
-                    
-                    page.screenshot(
-                        path=str(output_path),
-                        full_page=False,
-                        type="png"
-                    )
-                    
-                    image_paths.append(output_path)
-                    logger.info(f"✓ Generated: {output_path.name}")
-
-            except Exception as e:
-                logger.error(f"Batch conversion failed: {e}")
-                raise
-                
-            finally:
-                browser.close()
+        # Daemonic processes (e.g. Celery prefork workers) cannot have children
+        can_fork = not multiprocessing.current_process().daemon
+
+        if self._browser is None and max_workers > 1 and can_fork:
+            image_paths = self._render_parallel(html_files, output_dir, width, height, max_workers)
+        elif self._browser is not None:
+            image_paths = self._render_batch(self._browser, html_files, output_dir, width, height)
+        else:
+            with sync_playwright() as p:
+                # Launch browser once for all conversions
+                browser = p.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
+                try:
+                    image_paths = self._render_batch(browser, html_files, output_dir, width, height)
+                finally:
+                    browser.close()
 
         logger.info(f"Generated {len(image_paths)} images")
         return image_paths
 
+    def _render_parallel(
+        self,
+        html_files: List[Path],
+        output_dir: Path,
+        width: int,
+        height: int,
+        max_workers: int
+    ) -> List[Path]:
+        """Render HTML files across worker processes, preserving order."""
+        logger.info(f"Rendering with {max_workers} worker processes")
+
+        # Round-robin chunks so each worker launches a single browser
+        chunks = [html_files[i::max_workers] for i in range(max_workers)]
+
+        # Spawn, not fork: the parent has live threads (image fetches, cache
+        # priming, HTTP pools) and forking with them can deadlock the child
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=spawn) as executor:
+            results = list(executor.map(
+                _render_chunk,
+                chunks,
+                [output_dir] * max_workers,
+                [width] * max_workers,
+                [height] * max_workers,
+                [self.headless] * max_workers
+            ))
+
+        # Interleave chunk results back into the original slide order
+        image_paths = []
+        for i in range(len(html_files)):
+            image_paths.append(results[i % max_workers][i // max_workers])
+        return image_paths
+
+    def _render_batch(
+        self,
+        browser: Browser,
+        html_files: List[Path],
+        output_dir: Path,
+        width: int,
+        height: int
+    ) -> List[Path]:
+        """Render HTML files in order, reusing a single page."""
+        image_paths = []
+
+        context = browser.new_context(
+            viewport={"width": width, "height": height},
+            device_scale_factor=2
+        )
+
+        page = context.new_page()
+
+        try:
+            for html_file in html_files:
+                # Generate output path
+                output_path = output_dir / f"{html_file.stem}.png"
+
+                # Load and screenshot
+                html_url = f"file://{html_file.absolute()}"
+                page.goto(html_url, wait_until="networkidle")
+                page.wait_for_timeout(500)  # Wait for fonts
+
+                page.screenshot(
+                    path=str(output_path),
+                    full_page=False,
+                    type="png"
+                )
+
+                image_paths.append(output_path)
+                logger.info("✓ Generated: %s", output_path.name)
+
+        except Exception as e:
+            logger.error(f"Batch conversion failed: {e}")
+            raise
+
+        finally:
+            context.close()
+
+        return image_paths
+
+
+def _render_chunk(
+    html_files: List[Path],
+    output_dir: Path,
+    width: int,
+    height: int,
+    headless: bool
+) -> List[Path]:
+    """Render a chunk of HTML files with one browser (runs in a worker process)."""
+    converter = HTMLToImageConverter(headless=headless)
+    with converter:
+        return converter.convert_html_files_to_images(html_files, output_dir, width, height)
+
 
 def convert_html_to_image(
     html_path: Path,
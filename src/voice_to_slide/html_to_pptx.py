@@ -67,7 +67,7 @@ class HTMLToPPTXConverter:
         blank_layout = prs.slide_layouts[6]  # Blank layout
 
         for i, image_path in enumerate(image_paths):
-            logger.debug(f"Adding slide {i+1}/{len(image_paths)}: {image_path.name}")
+            logger.debug("Adding slide %d/%d: %s", i + 1, len(image_paths), image_path.name)
 
             # Add blank slide
             slide = prs.slides.add_slide(blank_layout)
@@ -88,7 +88,7 @@ class HTMLToPPTXConverter:
                     width=width,
                     height=height
                 )
-                logger.info(f"✓ Added slide {i+1}: {image_path.name}")
+                logger.info("✓ Added slide %d: %s", i + 1, image_path.name)
 
             except Exception as e:
                 logger.error(f"Failed to add image {image_path}: {e}")
@@ -2,6 +2,8 @@
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from PIL import Image
@@ -12,6 +14,11 @@ logger = get_logger(__name__)
 class ImageFetcher:
     """Fetches relevant images from Unsplash API."""
 
+    # Maximum concurrent Unsplash requests
+    MAX_WORKERS = 8
+    # Read size when streaming image downloads to disk
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -37,6 +44,13 @@ class ImageFetcher:
         self.max_height = max_height
         ensure_directory(self.cache_dir)
 
+        # One keep-alive session shared by all requests (and worker threads)
+        # so TLS handshakes to Unsplash are paid once per connection
+        self.headers = {"Authorization": f"Client-ID {self.api_key}"}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.MAX_WORKERS)
+        self.session.mount("https://", adapter)
+
         logger.info(f"ImageFetcher initialized (max size: {max_width}x{max_height})")
 
     def search_photo(
@@ -58,9 +72,6 @@ class ImageFetcher:
         logger.info(f"Searching Unsplash for: {query}")
 
         url = f"{self.base_url}/search/photos"
-        headers = {
-            "Authorization": f"Client-ID {self.api_key}"
-        }
         params = {
             "query": query,
             "orientation": orientation,
@@ -68,7 +79,7 @@ class ImageFetcher:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -129,13 +140,14 @@ class ImageFetcher:
         try:
             # Trigger download endpoint (required by Unsplash API guidelines)
             download_url = photo_data.get("download_url") or photo_data.get("url")
-            response = requests.get(download_url, timeout=30)
-            response.raise_for_status()
-
-            # Save temporarily
             temp_path = filepath.with_suffix('.tmp.jpg')
-            with open(temp_path, 'wb') as f:
-                f.write(response.content)
+            with self.session.get(download_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+
+                # Stream to a temp file instead of holding the whole body in memory
+                with open(temp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
 
             # Resize if enabled
             if resize:
@@ -198,66 +210,87 @@ class ImageFetcher:
                 with open(output_path, 'wb') as f_out:
                     f_out.write(f_in.read())
 
+    def get_image_url(self, query: str) -> Optional[Dict[str, Any]]:
+        """Get image URL and metadata for a single query without downloading.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Dict with {url, width, height, description} or None if the query failed
+        """
+        try:
+            logger.debug("Searching Unsplash for: %s", query)
+
+            response = self.session.get(
+                f"{self.base_url}/search/photos",
+                headers=self.headers,
+                params={
+                    "query": query,
+                    "per_page": 1,
+                    "orientation": "landscape"
+                },
+                timeout=10
+            )
+
+            if response.status_code != 200:
+                logger.error(f"Unsplash API error: {response.status_code}")
+                return None
+
+            data = response.json()
+            if not data.get("results"):
+                logger.warning(f"No images found for '{query}'")
+                return None
+
+            photo = data["results"][0]
+            logger.info("✓ Found image for '%s': %.60s...", query, photo['urls']['regular'])
+            return {
+                "url": photo["urls"]["regular"],  # High quality URL (~1080px width)
+                "width": photo["width"],
+                "height": photo["height"],
+                "description": photo.get("description") or photo.get("alt_description") or query,
+                "photographer": photo["user"]["name"],
+                "photographer_url": photo["user"]["links"]["html"]
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to fetch image URL for '{query}': {e}")
+            return None
+
     def get_image_urls_for_presentation(self, queries: List[str]) -> List[Optional[Dict[str, Any]]]:
         """Get image URLs and metadata without downloading.
 
+        Queries are sent concurrently over the shared session.
+
         Args:
             queries: List of search queries for each slide
 
         Returns:
-            List of dicts with {url, width, height, description} or None for failed queries
+            List of dicts with {url, width, height, description} or None for
+            failed or empty queries
         """
         if not queries:
             return []
 
         logger.info(f"Fetching image URLs for {len(queries)} slides...")
 
-        results = []
-        for i, query in enumerate(queries):
-            try:
-                logger.debug(f"Searching Unsplash for: {query}")
-                
-                headers = {"Authorization": f"Client-ID {self.api_key}"}
-                response = requests.get(
-                    f"{self.base_url}/search/photos",
-                    headers=headers,
-                    params={
-                        "query": query,
-                        "per_page": 1,
-                        "orientation": "landscape"
-                    },
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if data.get("results"):
-                        photo = data["results"][0]
-                        image_info = {
-                            "url": photo["urls"]["regular"],  # High quality URL (~1080px width)
-                            "width": photo["width"],
-                            "height": photo["height"],
-                            "description": photo.get("description") or photo.get("alt_description") or query,
-                            "photographer": photo["user"]["name"],
-                            "photographer_url": photo["user"]["links"]["html"]
-                        }
-                        results.append(image_info)
-                        logger.info(f"✓ Found image for '{query}': {photo['urls']['regular'][:60]}...")
-                    else:
-                        logger.warning(f"No images found for '{query}'")
-                        results.append(None)
-                else:
-                    logger.error(f"Unsplash API error: {response.status_code}")
-                    results.append(None)
-                    
-            except Exception as e:
-                logger.error(f"Failed to fetch image URL for '{query}': {e}")
-                results.append(None)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+
+        # Empty queries would only cost an Unsplash request (and rate limit)
+        valid = [(i, query) for i, query in enumerate(queries) if query]
+        skipped = len(queries) - len(valid)
+        if skipped:
+            logger.warning(f"Skipping {skipped} slide(s) with empty image query")
+
+        if valid:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(valid))) as executor:
+                urls = executor.map(lambda item: self.get_image_url(item[1]), valid)
+                for (i, _), image_info in zip(valid, urls):
+                    results[i] = image_info
 
         successful = sum(1 for r in results if r is not None)
         logger.info(f"Successfully fetched {successful}/{len(queries)} image URLs")
-        
+
         return results
 
     def fetch_image_for_slide(
@@ -295,15 +328,23 @@ class ImageFetcher:
         """
         logger.info(f"Fetching {len(image_queries)} images for presentation")
 
-        image_paths = []
-        for i, query in enumerate(image_queries):
-            if not query:
-                logger.warning(f"Slide {i}: Empty query, skipping image")
-                image_paths.append(None)
-                continue
+        image_paths: list[Optional[Path]] = [None] * len(image_queries)
+
+        # Drop empty queries up front so the pool is sized to real work
+        valid = [(i, query) for i, query in enumerate(image_queries) if query]
+        skipped = len(image_queries) - len(valid)
+        if skipped:
+            logger.warning(f"Skipping {skipped} slide(s) with empty image query")
 
-            image_path = self.fetch_image_for_slide(query, i)
-            image_paths.append(image_path)
+        if valid:
+            # Downloads are network-bound and write to distinct files
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(valid))) as executor:
+                results = executor.map(
+                    lambda item: self.fetch_image_for_slide(item[1], item[0]),
+                    valid
+                )
+                for (i, _), image_path in zip(valid, results):
+                    image_paths[i] = image_path
 
         successful = sum(1 for p in image_paths if p is not None)
         logger.info(f"Successfully fetched {successful}/{len(image_queries)} images")
@@ -4,17 +4,46 @@ import os
 import sys
 from pathlib import Path
 import click
-from dotenv import load_dotenv
 
-from .transcriber import AudioTranscriber
-from .presentation_orchestrator import PresentationOrchestrator
+# Heavy modules (transcriber, orchestrator) are imported inside the commands
+# that use them so that `check` and `--help` start quickly.
 from .utils import get_logger, sanitize_filename, ensure_directory
 
-# Load environment variables
-load_dotenv()
-
 logger = get_logger(__name__)
 
+# Static CLI text, built once
+FEEDBACK_BANNER = "\n".join([
+    "💬 FEEDBACK MODE",
+    "=" * 50,
+    "You can now provide feedback to edit the structure.",
+    "Type your feedback and press Enter.",
+    "Type '/start' when ready to generate slides.",
+    "=" * 50,
+    "",
+])
+
+FINAL_STRUCTURE_BANNER = "\n".join([
+    "\n" + "=" * 70,
+    "✅ FINAL STRUCTURE - Ready to generate slides!",
+    "=" * 70,
+    "",
+])
+
+GENERATION_STEPS = "\n".join([
+    "   • Generating HTML slides with Claude Messages API",
+    "   • Rendering HTML to high-quality images (Playwright)",
+    "   • Fetching images from Unsplash",
+    "   • Creating PPTX with rendered slides",
+    "",
+])
+
+# API keys reported by the `check` command (display name -> env var)
+API_KEYS = {
+    "Soniox API": "SONIOX_API_KEY",
+    "Claude AI": "CONTENT_ANTHROPIC_API_KEY",
+    "Unsplash Images": "UNSPLASH_ACCESS_KEY"
+}
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -24,7 +53,11 @@ def cli():
     This tool transcribes audio files and automatically generates PowerPoint
     presentations using Claude AI Tool Use and local python-pptx generation.
     """
-    pass
+    # Load environment variables only when a command actually runs
+    # (not for --help / --version)
+    from dotenv import load_dotenv
+    load_dotenv()
+    get_logger(__name__)  # Re-apply LOG_LEVEL now that .env is loaded
 
 
 @cli.command()
@@ -61,7 +94,12 @@ def cli():
     default=False,
     help='Enable interactive editing of structure before generation (default: disabled)'
 )
-def generate(audio_file, output, theme, images, save_transcription, interactive):
+@click.option(
+    '--cache/--no-cache',
+    default=True,
+    help='Reuse cached transcription and structure analysis of the same audio content (default: enabled)'
+)
+def generate(audio_file, output, theme, images, save_transcription, interactive, cache):
     """Generate a presentation from an audio file.
 
     AUDIO_FILE: Path to the audio file (MP3, WAV, M4A, etc.)
@@ -73,11 +111,15 @@ def generate(audio_file, output, theme, images, save_transcription, interactive)
         voice-to-slide generate recording.mp3 --theme "Vibrant Creative" --no-images
         voice-to-slide generate recording.mp3 --interactive
     """
+    from .transcriber import AudioTranscriber
+    from .presentation_orchestrator import PresentationOrchestrator
+
     try:
-        click.echo(f"🎙️  Voice-to-Slide Generator")
-        click.echo(f"{'=' * 50}")
-        click.echo(f"Audio file: {audio_file}")
-        click.echo()
+        click.echo(
+            f"🎙️  Voice-to-Slide Generator\n"
+            f"{'=' * 50}\n"
+            f"Audio file: {audio_file}\n"
+        )
 
         # Determine output path
         if output is None:
@@ -89,10 +131,10 @@ def generate(audio_file, output, theme, images, save_transcription, interactive)
         # Step 1: Transcribe audio
         click.echo("📝 Step 1: Transcribing audio...")
         transcriber = AudioTranscriber()
-        transcription = transcriber.transcribe(audio_file)
+        transcription = transcriber.transcribe(audio_file, use_cache=cache)
 
         if save_transcription:
-            transcription_path = output.with_suffix('.transcription.json')
+            transcription_path = output.parent / f"{output.stem}.transcription.json"
             from .utils import save_json
             save_json(transcription, transcription_path)
             click.echo(f"   Saved transcription to: {transcription_path}")
@@ -106,23 +148,18 @@ def generate(audio_file, output, theme, images, save_transcription, interactive)
         orchestrator = PresentationOrchestrator()
 
         # Get structure
-        result = orchestrator.analyze_and_structure(transcription_text, use_images=images)
+        result = orchestrator.analyze_and_structure(
+            transcription_text, use_images=images, ignore_cache=not cache
+        )
         structure = result["structure"]
 
         # Show initial preview
         preview = orchestrator.format_structure_preview(structure)
-        click.echo(preview)
-        click.echo()
+        click.echo(preview + "\n")
 
         # Step 3: Interactive feedback loop (if enabled)
         if interactive:
-            click.echo("💬 FEEDBACK MODE")
-            click.echo("=" * 50)
-            click.echo("You can now provide feedback to edit the structure.")
-            click.echo("Type your feedback and press Enter.")
-            click.echo("Type '/start' when ready to generate slides.")
-            click.echo("=" * 50)
-            click.echo()
+            click.echo(FEEDBACK_BANNER)
 
             # Callback to get feedback from user
             def get_feedback():
@@ -130,10 +167,8 @@ def generate(audio_file, output, theme, images, save_transcription, interactive)
 
             # Callback to show updated structure
             def show_structure(updated_structure):
-                click.echo("\n✨ Structure updated!")
-                click.echo("=" * 70)
                 preview = orchestrator.format_structure_preview(updated_structure)
-                click.echo(preview)
+                click.echo(f"\n✨ Structure updated!\n{'=' * 70}\n{preview}")
 
             # Run feedback loop
             structure = orchestrator.allow_feedback_loop(
@@ -143,10 +178,7 @@ def generate(audio_file, output, theme, images, save_transcription, interactive)
             )
 
             # Show final structure after edits
-            click.echo("\n" + "=" * 70)
-            click.echo("✅ FINAL STRUCTURE - Ready to generate slides!")
-            click.echo("=" * 70)
-            click.echo()
+            click.echo(FINAL_STRUCTURE_BANNER)
         else:
             # Step 3 (non-interactive): Confirm generation
             if not click.confirm('\n⚠️  Proceed with presentation generation?', default=True):
@@ -156,15 +188,14 @@ def generate(audio_file, output, theme, images, save_transcription, interactive)
             click.echo()
 
         # Step 4: Generate presentation locally (Strategy B with HTML)
-        click.echo("🎨 Step 4: Generating presentation (Strategy B: HTML → Images → PPTX)...")
-        click.echo(f"   • Theme: {theme}")
+        steps = [
+            "🎨 Step 4: Generating presentation (Strategy B: HTML → Images → PPTX)...",
+            f"   • Theme: {theme}",
+        ]
         if interactive:
-            click.echo(f"   • Using edited structure from feedback loop")
-        click.echo(f"   • Generating HTML slides with Claude Messages API")
-        click.echo(f"   • Rendering HTML to high-quality images (Playwright)")
-        click.echo(f"   • Fetching images from Unsplash")
-        click.echo(f"   • Creating PPTX with rendered slides")
-        click.echo()
+            steps.append("   • Using edited structure from feedback loop")
+        steps.append(GENERATION_STEPS)
+        click.echo("\n".join(steps))
 
         # Generate with structure (either original or edited)
         result = orchestrator.generate_presentation(
@@ -176,14 +207,17 @@ def generate(audio_file, output, theme, images, save_transcription, interactive)
         )
 
         if result['status'] == 'success':
-            click.echo()
-            click.echo(f"✅ Success! Presentation generated:")
-            click.echo(f"   📄 File: {result['output_path']}")
-            click.echo(f"   🎨 Theme: {result.get('theme', 'N/A')}")
-            click.echo(f"   📊 Total slides: {result['total_slides']}")
-            click.echo(f"   🖼️  Images: {result['images_fetched']}/{len(result['structure'].get('slides', []))}")
+            summary = [
+                "",
+                "✅ Success! Presentation generated:",
+                f"   📄 File: {result['output_path']}",
+                f"   🎨 Theme: {result.get('theme', 'N/A')}",
+                f"   📊 Total slides: {result['total_slides']}",
+                f"   🖼️  Images: {result['images_fetched']}/{len(result['structure'].get('slides', []))}",
+            ]
             if 'html_files' in result:
-                click.echo(f"   📝 HTML files: {len(result['html_files'])} generated")
+                summary.append(f"   📝 HTML files: {len(result['html_files'])} generated")
+            click.echo("\n".join(summary))
         else:
             click.echo()
             click.echo(f"❌ Generation failed: {result.get('error')}")
@@ -211,6 +245,8 @@ def transcribe(audio_file, output):
         voice-to-slide transcribe recording.mp3
         voice-to-slide transcribe audio.wav --output transcript.json
     """
+    from .transcriber import AudioTranscriber
+
     try:
         click.echo(f"📝 Transcribing: {audio_file}")
 
@@ -219,7 +255,7 @@ def transcribe(audio_file, output):
 
         # Determine output path
         if output is None:
-            output = audio_file.with_suffix('.transcription.json')
+            output = audio_file.parent / f"{audio_file.stem}.transcription.json"
 
         from .utils import save_json
         save_json(transcription, output)
@@ -236,34 +272,23 @@ def transcribe(audio_file, output):
 @cli.command()
 def check():
     """Check if all required API keys are configured."""
-    click.echo("🔍 Checking configuration...")
-    click.echo()
-
-    keys = {
-        "Soniox API": "SONIOX_API_KEY",
-        "Claude AI": "CONTENT_ANTHROPIC_API_KEY",
-        "Unsplash Images": "UNSPLASH_ACCESS_KEY"
-    }
-
-    all_configured = True
-
-    for name, env_var in keys.items():
-        value = os.getenv(env_var)
-        if value:
-            masked = value[:8] + "..." if len(value) > 8 else "***"
-            click.echo(f"✅ {name:30} {masked}")
-        else:
-            click.echo(f"❌ {name:30} Not configured")
-            all_configured = False
-
-    click.echo()
-    if all_configured:
-        click.echo("✅ All required API keys are configured!")
+    values = {name: os.environ.get(env_var) for name, env_var in API_KEYS.items()}
+    lines = ["🔍 Checking configuration...", ""]
+    lines += [
+        f"✅ {name:30} {value[:8] + '...' if len(value) > 8 else '***'}" if value
+        else f"❌ {name:30} Not configured"
+        for name, value in values.items()
+    ]
+    lines.append("")
+
+    if all(values.values()):
+        lines.append("✅ All required API keys are configured!")
+        click.echo("\n".join(lines))
     else:
-        click.echo("⚠️  Some required API keys are missing. Check .env file.")
-        click.echo("   Copy .env.example to .env and add your API keys.")
+        lines.append("⚠️  Some required API keys are missing. Check .env file.")
+        lines.append("   Copy .env.example to .env and add your API keys.")
+        click.echo("\n".join(lines))
         sys.exit(1)
 
-
 if __name__ == "__main__":
     cli()
@@ -1,29 +1,183 @@
 """Presentation orchestration using Claude Tool Use (Strategy B: Local Generation)."""
 
 import os
+import copy
 import json
+import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from anthropic import Anthropic
-from .utils import get_logger
+from typing import Dict, Any, Optional, List, Tuple
+from .utils import get_logger, get_cache_dir, save_json, load_json, dumps_json, log_cache_usage, get_anthropic_client, resolve_model, STATIC_CACHE_CONTROL
 from .image_fetcher import ImageFetcher
 from .slide_builder import SlideBuilder
-from .html_generator import HTMLSlideGenerator
+from .html_generator import HTMLSlideGenerator, wait_for_batch, BATCH_POLL_INTERVAL
 from .html_to_pptx import convert_html_to_pptx
 from .structure_editor import StructureEditor
 
 logger = get_logger(__name__)
 
+# Static request parts are module-level so they are built once and stay
+# byte-identical across calls; Anthropic prompt caching needs an exact prefix
+# match (tools -> system -> static instructions) to get a cache hit.
+_TOOL_DEFINITIONS: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "analyze_presentation_structure",
+        "description": """Analyze transcription and determine presentation structure.
+        
+        This tool should extract:
+        - Main title for the presentation
+        - List of slides with titles and key bullet points
+        - Suggested image themes for each slide (if applicable)
+        
+        Create a clear, logical flow with:
+        - Opening slide with main topic
+        - 3-7 content slides covering key points
+        - Optional closing slide with conclusions/takeaways
+        """,
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Main presentation title"
+                },
+                "slides": {
+                    "type": "array",
+                    "description": "List of content slides",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {
+                                "type": "string",
+                                "description": "Slide title"
+                            },
+                            "bullet_points": {
+                                "type": "array",
+                                "description": "Key points for this slide (3-5 points)",
+                                "items": {"type": "string"}
+                            },
+                            "image_theme": {
+                                "type": "string",
+                                "description": "Optional image search query for this slide (e.g., 'business meeting', 'data analytics')"
+                            }
+                        },
+                        "required": ["title", "bullet_points"]
+                    }
+                }
+            },
+            "required": ["title", "slides"]
+        }
+    },
+    {
+        "name": "fetch_images_from_unsplash",
+        "description": """Fetch images from Unsplash API based on search queries.
+        
+        Use this tool to get relevant images for presentation slides.
+        Each query should be descriptive (e.g., 'modern office workspace', 
+        'data visualization charts', 'team collaboration').
+        
+        Images will be downloaded and cached locally for use in the presentation.
+        """,
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "queries": {
+                    "type": "array",
+                    "description": "List of search queries for images",
+                    "items": {
+                        "type": "string",
+                        "description": "Image search query"
+                    }
+                }
+            },
+            "required": ["queries"]
+        }
+    }
+)
+
+_SYSTEM_PROMPT = (
+    "You are an expert presentation designer. You turn spoken transcriptions "
+    "into clear, well-structured slide decks using the tools provided."
+)
+
+_ANALYSIS_INSTRUCTIONS = """Analyze the transcription below and create a professional presentation structure.
+
+Instructions:
+1. Extract the main topic and create a compelling title
+2. Organize content into 4-8 logical slides
+3. For each slide, create 3-5 clear, concise bullet points
+4. {image_instruction}
+5. Ensure the presentation flows logically from introduction to conclusion
+
+Use the analyze_presentation_structure tool to provide the complete structure.
+{image_tool_instruction}
+
+TRANSCRIPTION:"""
+
+# Fully rendered per use_images, so the cached prefix is byte-identical on
+# every call and the transcription block carries only the transcript itself
+_ANALYSIS_PREAMBLE = {
+    True: _ANALYSIS_INSTRUCTIONS.format(
+        image_instruction="Suggest relevant image themes for each slide",
+        image_tool_instruction="Then use fetch_images_from_unsplash to get images for each slide."
+    ),
+    False: _ANALYSIS_INSTRUCTIONS.format(
+        image_instruction="Focus on text content only",
+        image_tool_instruction=""
+    ),
+}
+
+# Upper bound on request/tool-result rounds in the image refinement loop
+MAX_TOOL_ROUNDS = 3
+
+_IMAGE_REVIEW_INSTRUCTION = (
+    "\n\nThese are the images Unsplash returned for your queries. If any "
+    "description does not fit its slide, or no image was found, call "
+    "fetch_images_from_unsplash again with improved queries for all slides. "
+    "Otherwise reply briefly to finish."
+)
+
+# Preview separators, built once
+_PREVIEW_RULE = "=" * 70
+_PREVIEW_DIVIDER = "\n" + "-" * 70
+
+# Transcriptions longer than this many input tokens are condensed before
+# analysis (VOICE_TO_SLIDE_SUMMARIZE_TOKENS, 0 disables)
+SUMMARIZE_TOKEN_THRESHOLD = 50000
+
+_SUMMARY_PROMPT = """Condense the transcription below into detailed notes for building a slide deck.
+Keep every topic, argument, example, number and name in the original order and language.
+Drop filler words, repetitions and digressions. Return only the notes."""
+
+# Fingerprint of everything that shapes an analysis besides the model and
+# the transcript; part of the cache key so prompt or schema edits
+# invalidate cached analyses. Hashed from stdlib json (not dumps_json) so
+# the key does not depend on whether orjson is installed.
+_ANALYSIS_PROMPT_VERSION = hashlib.blake2b(
+    json.dumps(
+        [_TOOL_DEFINITIONS, _SYSTEM_PROMPT, _ANALYSIS_PREAMBLE[True], _ANALYSIS_PREAMBLE[False], _SUMMARY_PROMPT],
+        sort_keys=True
+    ).encode("utf-8"),
+    digest_size=8
+).hexdigest()
+
 
 class PresentationOrchestrator:
     """Orchestrates presentation generation using Claude Tool Use and local execution."""
 
-    def __init__(self, api_key: str | None = None, model: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        cache_dir: Path | str | None = None
+    ):
         """Initialize the orchestrator.
 
         Args:
             api_key: Anthropic API key. If None, reads from CONTENT_ANTHROPIC_API_KEY env var.
             model: Claude model to use. If None, reads from CONTENT_MODEL env var (default: claude-haiku-4-5-20251001)
+            cache_dir: Directory for cached structure analyses (default: ~/.cache/voice-to-slide/analysis)
         """
         self.api_key = api_key or os.getenv("CONTENT_ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -32,160 +186,383 @@ class PresentationOrchestrator:
             )
 
         # Get model from env or use default
-        self.model = model or os.getenv("CONTENT_MODEL", "claude-haiku-4-5-20251001")
-
-        # Setup client with optional custom base URL and prompt caching
-        base_url = os.getenv("CONTENT_ANTHROPIC_BASE_URL")
-        client_kwargs = {
-            "api_key": self.api_key,
-            "default_headers": {
-                "anthropic-beta": "prompt-caching-2024-07-31"
-            }
-        }
-        if base_url:
-            client_kwargs["base_url"] = base_url
-            logger.info(f"Using custom base URL: {base_url}")
+        self._model = resolve_model(model)
+
+        self.base_url = os.getenv("CONTENT_ANTHROPIC_BASE_URL")
+
+        self.cache_dir = Path(cache_dir) if cache_dir else get_cache_dir("analysis")
+
+        # Most recent analysis as (cache path, result), so preview_structure
+        # followed by generate_presentation on the same text needs no reload.
+        # Callers get their own copy, since they may edit the structure.
+        self._last_analysis: Optional[Tuple[Path, Dict[str, Any]]] = None
 
-        self.client = Anthropic(**client_kwargs)
-        logger.info("Prompt caching enabled")
-        
         logger.info(f"PresentationOrchestrator initialized with model: {self.model}")
 
-    def _get_tool_definitions(self) -> List[Dict[str, Any]]:
+    @property
+    def model(self) -> str:
+        """Claude model, fixed at construction so prompt cache entries stay valid."""
+        return self._model
+
+    @cached_property
+    def client(self):
+        """Anthropic client, created on first API use (shared process-wide)."""
+        return get_anthropic_client(self.api_key, self.base_url)
+
+    def _get_tool_definitions(self) -> Tuple[Dict[str, Any], ...]:
         """Get tool definitions for Claude.
 
         Returns:
-            List of tool definitions
+            Tool definitions (a shared module constant; do not mutate)
         """
-        return [
-            {
-                "name": "analyze_presentation_structure",
-                "description": """Analyze transcription and determine presentation structure.
-                
-                This tool should extract:
-                - Main title for the presentation
-                - List of slides with titles and key bullet points
-                - Suggested image themes for each slide (if applicable)
-                
-                Create a clear, logical flow with:
-                - Opening slide with main topic
-                - 3-7 content slides covering key points
-                - Optional closing slide with conclusions/takeaways
-                """,
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "Main presentation title"
-                        },
-                        "slides": {
-                            "type": "array",
-                            "description": "List of content slides",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "title": {
-                                        "type": "string",
-                                        "description": "Slide title"
-                                    },
-                                    "bullet_points": {
-                                        "type": "array",
-                                        "description": "Key points for this slide (3-5 points)",
-                                        "items": {"type": "string"}
-                                    },
-                                    "image_theme": {
-                                        "type": "string",
-                                        "description": "Optional image search query for this slide (e.g., 'business meeting', 'data analytics')"
-                                    }
-                                },
-                                "required": ["title", "bullet_points"]
-                            }
-                        }
-                    },
-                    "required": ["title", "slides"]
-                }
-            },
-            {
-                "name": "fetch_images_from_unsplash",
-                "description": """Fetch images from Unsplash API based on search queries.
-                
-                Use this tool to get relevant images for presentation slides.
-                Each query should be descriptive (e.g., 'modern office workspace', 
-                'data visualization charts', 'team collaboration').
-                
-                Images will be downloaded and cached locally for use in the presentation.
-                """,
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "queries": {
-                            "type": "array",
-                            "description": "List of search queries for images",
-                            "items": {
-                                "type": "string",
-                                "description": "Image search query"
-                            }
-                        }
-                    },
-                    "required": ["queries"]
-                }
-            }
-        ]
+        return _TOOL_DEFINITIONS
 
     def analyze_and_structure(
         self,
         transcription_text: str,
-        use_images: bool = True
+        use_images: bool = True,
+        ignore_cache: bool = False,
+        refine_images: Optional[bool] = None,
+        include_full_transcript: bool = False
     ) -> Dict[str, Any]:
         """Analyze transcription and get presentation structure using Tool Use.
 
         Args:
             transcription_text: Transcribed audio text
             use_images: Whether to suggest images for slides
+            ignore_cache: Skip the cached analysis lookup (the fresh result
+                          still replaces the cache entry)
+            refine_images: Run the image tool for Claude and let it retry
+                           off-theme queries (see _run_tool_loop). Defaults to
+                           the VOICE_TO_SLIDE_REFINE_IMAGES env var.
+            include_full_transcript: When a long transcription is condensed,
+                                     send the full text after the notes
+                                     instead of the notes alone
 
         Returns:
-            Dictionary with structure and image queries
+            Dictionary with structure and image queries (plus the fetched
+            image_data when images were refined)
         """
+        cache_path = self._analysis_cache_path(transcription_text, use_images, include_full_transcript)
+        if not ignore_cache and self._last_analysis is not None and self._last_analysis[0] == cache_path:
+            logger.info("Reusing structure analysis from this session")
+            return copy.deepcopy(self._last_analysis[1])
+
+        cached = None if ignore_cache else self._load_cached_analysis(cache_path)
+        if cached is not None:
+            logger.info(f"Using cached structure analysis: {cache_path.name}")
+            self._last_analysis = (cache_path, copy.deepcopy(cached))
+            return cached
+
+        transcription_text = self._maybe_compress(transcription_text, include_full_transcript)
+
         logger.info("Analyzing transcription with Claude Tool Use")
 
-        # Build prompt
-        prompt = f"""Analyze this transcription and create a professional presentation structure.
+        if refine_images is None:
+            refine_images = os.getenv("VOICE_TO_SLIDE_REFINE_IMAGES", "").lower() in ("1", "true", "yes")
+        if use_images and refine_images:
+            result = self._run_tool_loop(transcription_text)
+            self._save_analysis(result, cache_path)
+            self._last_analysis = (cache_path, copy.deepcopy(result))
+            return result
 
-Transcription:
-{transcription_text}
+        response = self._stream_analysis(transcription_text, use_images)
 
-Instructions:
-1. Extract the main topic and create a compelling title
-2. Organize content into 4-8 logical slides
-3. For each slide, create 3-5 clear, concise bullet points
-4. {"Suggest relevant image themes for each slide" if use_images else "Focus on text content only"}
-5. Ensure the presentation flows logically from introduction to conclusion
+        logger.info(f"Claude response - stop_reason: {response.stop_reason}")
+        log_cache_usage(logger, response.usage)
 
-Use the analyze_presentation_structure tool to provide the complete structure.
-{"Then use fetch_images_from_unsplash to get images for each slide." if use_images else ""}"""
+        result = self._parse_analysis(response.content, use_images)
+        self._save_analysis(result, cache_path)
+        self._last_analysis = (cache_path, copy.deepcopy(result))
+        return result
 
-        # Initial request with tool definitions
-        response = self.client.messages.create(
+    def _run_tool_loop(self, transcription_text: str) -> Dict[str, Any]:
+        """Analyze with a tool loop that executes the image tool for Claude.
+
+        Each fetch_images_from_unsplash call is run locally and its results
+        (what Unsplash actually found per query) are returned as tool results,
+        so Claude can re-issue better queries for off-theme images before it
+        finishes. The images fetched in the last round are returned with the
+        structure so generate_presentation does not look them up again.
+
+        Args:
+            transcription_text: Transcribed audio text
+
+        Returns:
+            Dictionary with structure, image queries and image_data
+        """
+        params = self._analysis_params(transcription_text, use_images=True)
+        messages = list(params.pop("messages"))
+        blocks: List[Any] = []
+        queries: List[str] = []
+        image_data: Optional[List[Optional[Dict[str, Any]]]] = None
+
+        for round_number in range(1, MAX_TOOL_ROUNDS + 1):
+            response = self.client.messages.create(messages=messages, **params)
+            log_cache_usage(logger, response.usage)
+            blocks.extend(response.content)
+
+            if response.stop_reason != "tool_use" or round_number == MAX_TOOL_ROUNDS:
+                break
+
+            tool_results = []
+            for block in response.content:
+                if block.type != "tool_use":
+                    continue
+                if block.name == "fetch_images_from_unsplash":
+                    queries = block.input.get("queries", [])
+                    image_data = self.fetch_images(queries)
+                    content = dumps_json([
+                        {"query": q, "found": d is not None, "description": d.get("description") if d else None}
+                        for q, d in zip(queries, image_data)
+                    ]).decode("utf-8") + _IMAGE_REVIEW_INSTRUCTION
+                else:
+                    content = "Structure recorded."
+                tool_results.append({"type": "tool_result", "tool_use_id": block.id, "content": content})
+
+            messages.append({"role": "assistant", "content": response.content})
+            messages.append({"role": "user", "content": tool_results})
+
+        result = self._parse_analysis(blocks, use_images=True)
+        # Only hand the images on if they match the queries Claude settled on
+        if image_data is not None and result["image_queries"] == queries:
+            result["image_data"] = image_data
+        return result
+
+    def _stream_analysis(self, transcription_text: str, use_images: bool) -> Any:
+        """Run the analysis request, stopping as soon as the needed tool calls are complete.
+
+        The response is streamed and closed once the structure tool call
+        (and the image query tool call, when images are requested) has been
+        fully received, so any trailing text the model would add is neither
+        waited for nor billed.
+
+        Args:
+            transcription_text: Transcribed audio text
+            use_images: Whether to suggest images for slides
+
+        Returns:
+            The (possibly partial) response message
+        """
+        needed = {"analyze_presentation_structure"}
+        if use_images:
+            needed.add("fetch_images_from_unsplash")
+
+        with self.client.messages.stream(**self._analysis_params(transcription_text, use_images)) as stream:
+            for event in stream:
+                if event.type != "content_block_stop":
+                    continue
+                received = {
+                    block.name for block in stream.current_message_snapshot.content
+                    if block.type == "tool_use"
+                }
+                if needed <= received:
+                    logger.info("All tool calls received, closing stream early")
+                    break
+            return stream.current_message_snapshot
+
+    def analyze_batch(
+        self,
+        transcriptions: List[str],
+        use_images: bool = True,
+        poll_interval: float = BATCH_POLL_INTERVAL
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several transcriptions through the Message Batches API.
+
+        Batched requests cost half as much as analyze_and_structure calls but
+        finish asynchronously (usually minutes, at most 24 hours), so this is
+        meant for processing a folder of recordings rather than interactive
+        use. Cached analyses are returned without being resubmitted, and
+        results are written to the same cache as analyze_and_structure.
+
+        Args:
+            transcriptions: Transcribed audio texts
+            use_images: Whether to suggest images for slides
+            poll_interval: Initial seconds between batch status checks
+
+        Returns:
+            One analysis result per transcription, in order (None if its
+            request failed)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(transcriptions)
+        requests = []
+        cache_paths = {}
+
+        for i, text in enumerate(transcriptions):
+            cache_path = self._analysis_cache_path(text, use_images)
+            cached = self._load_cached_analysis(cache_path)
+            if cached is not None:
+                results[i] = cached
+                continue
+            custom_id = f"job-{i}"
+            cache_paths[custom_id] = (i, cache_path)
+            requests.append({
+                "custom_id": custom_id,
+                "params": self._analysis_params(self._maybe_compress(text), use_images)
+            })
+
+        if not requests:
+            logger.info("All analyses served from cache")
+            return results
+
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted analysis batch {batch.id} with {len(requests)} requests")
+        wait_for_batch(self.client, batch.id, poll_interval)
+
+        for entry in self.client.messages.batches.results(batch.id):
+            i, cache_path = cache_paths[entry.custom_id]
+            if entry.result.type != "succeeded":
+                logger.error(f"Analysis {entry.custom_id} {entry.result.type}")
+                continue
+            try:
+                results[i] = self._parse_analysis(entry.result.message.content, use_images)
+            except ValueError as e:
+                logger.error(f"Analysis {entry.custom_id} failed: {e}")
+                continue
+            self._save_analysis(results[i], cache_path)
+
+        return results
+
+    def generate_presentations_batch(
+        self,
+        transcriptions: List[str],
+        output_paths: List[Path | str],
+        use_images: bool = True,
+        theme: str = "Modern Professional"
+    ) -> List[Dict[str, Any]]:
+        """Generate presentations for several transcriptions through the Message Batches API.
+
+        Both the structure analyses and the HTML slides are sent as batches
+        (see analyze_batch and HTMLSlideGenerator.generate_slides_html_batch),
+        so every Claude request is billed at the batch rate. Images are looked
+        up per deck in between, and each deck is then rendered to PPTX.
+
+        Args:
+            transcriptions: Transcribed audio texts
+            output_paths: PPTX output path for each transcription
+            use_images: Whether to include images
+            theme: Theme name for styling (from themes.md)
+
+        Returns:
+            One result dictionary per transcription (see generate_presentation)
+
+        Raises:
+            ValueError: If transcriptions and output_paths differ in length
+        """
+        # Checked before submitting the (billed) batch
+        if len(transcriptions) != len(output_paths):
+            raise ValueError(
+                f"Got {len(transcriptions)} transcriptions but {len(output_paths)} output paths"
+            )
+
+        analyses = self.analyze_batch(transcriptions, use_images)
+
+        results: List[Dict[str, Any]] = [
+            {"status": "error", "error": "Structure analysis failed"} for _ in transcriptions
+        ]
+        indices = [i for i, analysis in enumerate(analyses) if analysis is not None]
+        if not indices:
+            return results
+
+        decks = []
+        for i in indices:
+            structure = analyses[i]["structure"]
+            image_data = analyses[i].get("image_data")
+            if image_data is None:
+                image_queries = self._image_queries_from_structure(structure) if use_images else []
+                image_data = self.fetch_images(image_queries) if image_queries else []
+            decks.append({"structure": structure, "image_data": image_data, "theme": theme})
+
+        html_generator = HTMLSlideGenerator(
+            api_key=self.api_key,
             model=self.model,
-            max_tokens=4096,
-            tools=self._get_tool_definitions(),
-            messages=[{
+            base_url=self.base_url
+        )
+        html_per_deck = html_generator.generate_slides_html_batch(decks)
+
+        for i, deck, html_files in zip(indices, decks, html_per_deck, strict=True):
+            structure = deck["structure"]
+            total_slides = len(structure.get("slides", [])) + 1
+            if len(html_files) != total_slides:
+                results[i] = {
+                    "status": "error",
+                    "error": f"{total_slides - len(html_files)} of {total_slides} slide requests failed"
+                }
+                continue
+
+            try:
+                output_path = convert_html_to_pptx(
+                    html_files=html_files,
+                    output_path=Path(output_paths[i]),
+                    image_dir=None  # Auto-generate in output dir
+                )
+            except Exception as e:
+                logger.exception(f"Presentation {i} conversion failed")
+                results[i] = {"status": "error", "error": str(e)}
+                continue
+
+            results[i] = {
+                "status": "success",
+                "output_path": str(output_path),
+                "structure": structure,
+                "images_fetched": len([p for p in deck["image_data"] if p is not None]),
+                "total_slides": total_slides,
+                "theme": theme,
+                "html_files": [str(f) for f in html_files]
+            }
+        return results
+
+    def _analysis_params(self, transcription_text: str, use_images: bool) -> Dict[str, Any]:
+        """Build the Messages API parameters for a structure analysis.
+
+        Args:
+            transcription_text: Transcribed audio text
+            use_images: Whether to suggest images for slides
+
+        Returns:
+            Keyword arguments for messages.create (also used as batch params)
+        """
+        # Static preamble first (cached), then the per-call transcription
+        return {
+            "model": self.model,
+            "max_tokens": 4096,
+            "tools": self._get_tool_definitions(),
+            "system": [{
+                "type": "text",
+                "text": _SYSTEM_PROMPT,
+                "cache_control": STATIC_CACHE_CONTROL
+            }],
+            "messages": [{
                 "role": "user",
-                "content": prompt
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _ANALYSIS_PREAMBLE[use_images],
+                        "cache_control": STATIC_CACHE_CONTROL
+                    },
+                    {
+                        "type": "text",
+                        "text": transcription_text
+                    }
+                ]
             }]
-        )
+        }
 
-        logger.info(f"Claude response - stop_reason: {response.stop_reason}")
+    def _parse_analysis(self, content: List[Any], use_images: bool) -> Dict[str, Any]:
+        """Extract structure and image queries from an analysis response.
 
-        # Extract tool uses
+        Args:
+            content: Response content blocks
+            use_images: Whether images were requested
+
+        Returns:
+            Dictionary with structure and image queries
+        """
         structure = None
         image_queries = []
 
-        for content_block in response.content:
+        for content_block in content:
             if content_block.type == "tool_use":
-                logger.info(f"Tool used: {content_block.name}")
-                
                 if content_block.name == "analyze_presentation_structure":
                     structure = content_block.input
                     logger.info(f"Structure received: {structure['title']}, {len(structure['slides'])} slides")
@@ -199,17 +576,141 @@ Use the analyze_presentation_structure tool to provide the complete structure.
 
         # Extract image themes from slides if not provided via tool
         if use_images and not image_queries:
-            image_queries = []
-            for slide in structure.get("slides", []):
-                theme = slide.get("image_theme", "")
-                if theme:
-                    image_queries.append(theme)
+            image_queries = self._image_queries_from_structure(structure)
 
         return {
             "structure": structure,
             "image_queries": image_queries if use_images else []
         }
 
+    @staticmethod
+    def _save_analysis(result: Dict[str, Any], cache_path: Path) -> None:
+        """Write an analysis result to the cache, logging (not raising) failures."""
+        try:
+            save_json(result, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache structure analysis: {e}")
+
+    def _maybe_compress(self, transcription_text: str, include_full_transcript: bool = False) -> str:
+        """Condense very long transcriptions before structure analysis.
+
+        Short texts are returned unchanged without any API call (a text can
+        never have more tokens than characters). Longer ones are measured with
+        the token counting endpoint and, above the threshold, replaced by a
+        single summarization call's output.
+
+        Args:
+            transcription_text: Transcribed audio text
+            include_full_transcript: Append the original text after the notes
+                                     when the transcription is condensed
+
+        Returns:
+            The original text, or condensed notes for very long recordings
+        """
+        try:
+            threshold = int(os.getenv("VOICE_TO_SLIDE_SUMMARIZE_TOKENS", SUMMARIZE_TOKEN_THRESHOLD))
+        except ValueError:
+            logger.warning(
+                f"Invalid VOICE_TO_SLIDE_SUMMARIZE_TOKENS, using {SUMMARIZE_TOKEN_THRESHOLD}"
+            )
+            threshold = SUMMARIZE_TOKEN_THRESHOLD
+        if threshold <= 0 or len(transcription_text) <= threshold:
+            return transcription_text
+
+        try:
+            tokens = self.client.messages.count_tokens(
+                model=self.model,
+                messages=[{"role": "user", "content": transcription_text}]
+            ).input_tokens
+        except Exception as e:
+            logger.warning(f"Token counting failed, sending full transcription: {e}")
+            return transcription_text
+
+        if tokens <= threshold:
+            return transcription_text
+
+        logger.info(f"Transcription is {tokens} tokens, condensing before analysis")
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=8192,
+            system=_SUMMARY_PROMPT,
+            messages=[{"role": "user", "content": transcription_text}]
+        )
+        summary = "".join(block.text for block in response.content if block.type == "text")
+        logger.info(f"Condensed transcription to {len(summary)} characters")
+        if not summary:
+            return transcription_text
+        if include_full_transcript:
+            return f"{summary}\n\nFULL TRANSCRIPTION:\n{transcription_text}"
+        return summary
+
+    @staticmethod
+    def _image_queries_from_structure(structure: Dict[str, Any]) -> List[str]:
+        """Collect the non-empty image themes of a structure's slides.
+
+        Args:
+            structure: Presentation structure
+
+        Returns:
+            Image search queries, in slide order
+        """
+        return [slide["image_theme"] for slide in structure.get("slides", []) if slide.get("image_theme")]
+
+    def clear_cache(self) -> int:
+        """Delete all cached structure analyses.
+
+        Returns:
+            Number of cache entries removed
+        """
+        self._last_analysis = None
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        logger.info(f"Cleared {removed} cached analyses from {self.cache_dir}")
+        return removed
+
+    def _analysis_cache_path(
+        self,
+        transcription_text: str,
+        use_images: bool,
+        include_full_transcript: bool = False
+    ) -> Path:
+        """Get the cache file for an analysis, keyed by model, prompt version, options and text.
+
+        Args:
+            transcription_text: Transcribed audio text
+            use_images: Whether images were requested
+            include_full_transcript: Whether condensed texts keep the full transcript
+
+        Returns:
+            Path to the cache file (may not exist yet)
+        """
+        options = f"{use_images}\0{include_full_transcript}"
+        key = hashlib.blake2b(
+            f"{self.model}\0{_ANALYSIS_PROMPT_VERSION}\0{options}\0{transcription_text}".encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _load_cached_analysis(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached analysis result.
+
+        Args:
+            cache_path: Path from _analysis_cache_path()
+
+        Returns:
+            Cached result or None on a miss or unreadable entry
+        """
+        if not cache_path.exists():
+            return None
+
+        try:
+            return load_json(cache_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable analysis cache entry {cache_path}: {e}")
+            return None
+
     def fetch_images(self, image_queries: List[str]) -> List[Optional[Dict[str, Any]]]:
         """Fetch image URLs using ImageFetcher (no download, just URLs).
 
@@ -223,11 +724,15 @@ Use the analyze_presentation_structure tool to provide the complete structure.
             logger.info("No image queries provided, skipping image fetch")
             return []
 
-        logger.info(f"Fetching {len(image_queries)} image URLs from Unsplash")
+        # Slides often share a theme; look each distinct query up once
+        unique_queries = list(dict.fromkeys(image_queries))
+        logger.info(f"Fetching {len(unique_queries)} image URLs from Unsplash "
+                    f"({len(image_queries)} slides)")
 
         try:
             fetcher = ImageFetcher()
-            image_data = fetcher.get_image_urls_for_presentation(image_queries)
+            by_query = dict(zip(unique_queries, fetcher.get_image_urls_for_presentation(unique_queries)))
+            image_data = [by_query[q] for q in image_queries]
             successful = sum(1 for p in image_data if p is not None)
             logger.info(f"Successfully fetched {successful}/{len(image_queries)} image URLs")
             return image_data
@@ -235,6 +740,21 @@ Use the analyze_presentation_structure tool to provide the complete structure.
             logger.error(f"Failed to fetch image URLs: {e}")
             return [None] * len(image_queries)
 
+    def download_images(self, image_queries: List[str]) -> List[Optional[Path]]:
+        """Download images to local files for direct PPTX embedding.
+
+        Args:
+            image_queries: List of search queries, one per slide
+
+        Returns:
+            List of image paths (None for failed downloads)
+        """
+        try:
+            return ImageFetcher().fetch_images_for_presentation(image_queries)
+        except ValueError as e:
+            logger.error(f"Failed to download images: {e}")
+            return [None] * len(image_queries)
+
     def generate_presentation(
         self,
         transcription_text: str = None,
@@ -262,6 +782,8 @@ Use the analyze_presentation_structure tool to provide the complete structure.
         logger.info(f"Starting presentation generation (Strategy B with {'HTML' if use_html_generation else 'direct'} generation)")
 
         try:
+            prefetched_images = None
+
             # Step 1: Analyze and structure using Claude Tool Use (if structure not provided)
             if structure is None:
                 if transcription_text is None:
@@ -269,39 +791,52 @@ Use the analyze_presentation_structure tool to provide the complete structure.
                 result = self.analyze_and_structure(transcription_text, use_images)
                 structure = result["structure"]
                 image_queries = result.get("image_queries", [])
+                prefetched_images = result.get("image_data")
             else:
                 # Extract image queries from provided structure
                 logger.info("Using provided structure, skipping analysis")
-                image_queries = []
-                if use_images:
-                    for slide in structure.get("slides", []):
-                        theme_query = slide.get("image_theme", "")
-                        if theme_query:
-                            image_queries.append(theme_query)
-
-            # Step 2: Fetch image URLs (no download, just metadata)
-            image_data = []
-            if use_images and image_queries:
-                image_data = self.fetch_images(image_queries)
+                image_queries = self._image_queries_from_structure(structure) if use_images else []
+
+            # Step 2: Fetch images in the background so it overlaps with
+            # generation. HTML slides only need URLs; direct PPTX embedding
+            # needs downloaded files.
+            executor = ThreadPoolExecutor(max_workers=1)
+            images_future = None
+            if use_images and use_html_generation and prefetched_images is not None:
+                # Already fetched during the analysis tool loop
+                images_future = Future()
+                images_future.set_result(prefetched_images)
+            elif use_images and image_queries:
+                fetch = self.fetch_images if use_html_generation else self.download_images
+                images_future = executor.submit(fetch, image_queries)
+            executor.shutdown(wait=False)
 
             # Step 3: Generate presentation
             if use_html_generation:
                 # NEW FLOW: HTML Generation → PPTX Conversion
                 logger.info(f"Generating HTML slides with theme: {theme}")
 
-                # Step 3a: Generate HTML slides using Messages API
-                base_url = os.getenv("CONTENT_ANTHROPIC_BASE_URL")
+                # Step 3a: Generate HTML slides using Messages API.
+                # The title slide needs no image, so it is generated while
+                # the Unsplash lookups are still in flight.
                 html_generator = HTMLSlideGenerator(
                     api_key=self.api_key,
                     model=self.model,
-                    base_url=base_url
+                    base_url=self.base_url
                 )
 
-                html_files = html_generator.generate_slides_html(
+                # Opt-in: emit every slide from one streaming request
+                single_request = os.getenv("VOICE_TO_SLIDE_SINGLE_REQUEST", "").lower() in ("1", "true", "yes")
+                generate_html = (
+                    html_generator.generate_slides_html_stream if single_request
+                    else html_generator.generate_slides_html
+                )
+                html_files = generate_html(
                     structure=structure,
-                    image_data=image_data,
+                    image_data=images_future or [],
                     theme=theme
                 )
+                image_data = images_future.result() if images_future else []
 
                 logger.info(f"Generated {len(html_files)} HTML files")
 
@@ -325,6 +860,7 @@ Use the analyze_presentation_structure tool to provide the complete structure.
 
             else:
                 # OLD FLOW: Direct PPTX generation
+                image_paths = images_future.result() if images_future else []
                 logger.info("Generating PPTX file directly")
                 output_path = SlideBuilder.create_presentation(
                     content=structure,
@@ -365,34 +901,7 @@ Use the analyze_presentation_structure tool to provide the complete structure.
         structure = result["structure"]
         image_queries = result["image_queries"]
 
-        lines = [
-            "=" * 70,
-            f"PRESENTATION PREVIEW",
-            "=" * 70,
-            f"\nTitle: {structure['title']}",
-            f"Total Slides: {len(structure['slides']) + 1} (including title slide)",
-            "\n" + "-" * 70,
-        ]
-
-        for i, slide in enumerate(structure.get("slides", []), 1):
-            lines.append(f"\nSlide {i + 1}: {slide['title']}")
-            
-            if "image_theme" in slide and slide["image_theme"]:
-                lines.append(f"  Image: {slide['image_theme']}")
-            
-            lines.append("  Points:")
-            for point in slide.get("bullet_points", []):
-                lines.append(f"    • {point}")
-
-        if image_queries:
-            lines.append("\n" + "-" * 70)
-            lines.append("\nImage Queries:")
-            for i, query in enumerate(image_queries, 1):
-                lines.append(f"  {i}. {query}")
-
-        lines.append("\n" + "=" * 70)
-
-        return "\n".join(lines)
+        return self._render_structure(structure, "PRESENTATION PREVIEW", image_queries)
 
     def format_structure_preview(self, structure: Dict[str, Any]) -> str:
         """Format structure for display.
@@ -403,26 +912,47 @@ Use the analyze_presentation_structure tool to provide the complete structure.
         Returns:
             Formatted preview string
         """
+        return self._render_structure(structure, "PRESENTATION STRUCTURE")
+
+    @staticmethod
+    def _render_structure(
+        structure: Dict[str, Any],
+        heading: str,
+        image_queries: Optional[List[str]] = None
+    ) -> str:
+        """Render a structure as a single display string.
+
+        Args:
+            structure: Presentation structure
+            heading: Banner heading
+            image_queries: Optional image queries to list after the slides
+
+        Returns:
+            Formatted string, built in one pass and joined once
+        """
+        slides = structure.get("slides", [])
         lines = [
-            "=" * 70,
-            f"PRESENTATION STRUCTURE",
-            "=" * 70,
+            _PREVIEW_RULE,
+            heading,
+            _PREVIEW_RULE,
             f"\nTitle: {structure['title']}",
-            f"Total Slides: {len(structure['slides']) + 1} (including title slide)",
-            "\n" + "-" * 70,
+            f"Total Slides: {len(slides) + 1} (including title slide)",
+            _PREVIEW_DIVIDER,
         ]
 
-        for i, slide in enumerate(structure.get("slides", []), 1):
-            lines.append(f"\nSlide {i + 1}: {slide['title']}")
-
-            if "image_theme" in slide and slide["image_theme"]:
+        for i, slide in enumerate(slides, 2):
+            lines.append(f"\nSlide {i}: {slide['title']}")
+            if slide.get("image_theme"):
                 lines.append(f"  Image: {slide['image_theme']}")
-
             lines.append("  Points:")
-            for point in slide.get("bullet_points", []):
-                lines.append(f"    • {point}")
+            lines.extend(f"    • {point}" for point in slide.get("bullet_points", []))
+
+        if image_queries:
+            lines.append(_PREVIEW_DIVIDER)
+            lines.append("\nImage Queries:")
+            lines.extend(f"  {i}. {query}" for i, query in enumerate(image_queries, 1))
 
-        lines.append("\n" + "=" * 70)
+        lines.append("\n" + _PREVIEW_RULE)
 
         return "\n".join(lines)
 
@@ -1,15 +1,55 @@
 """Slide building module using python-pptx."""
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, Any, List, Optional
+from xml.sax.saxutils import escape
 from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from .utils import get_logger, ensure_directory
 
 logger = get_logger(__name__)
 
+# Control characters XML 1.0 forbids; python-pptx writes them as "_xHHHH_"
+_CTRL_CHAR_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# Other characters outside XML 1.0's Char range; they have no escape, so
+# they are dropped (python-pptx would fail on them)
+_NON_XML_CHAR_RE = re.compile("[\ud800-\udfff\ufffe\uffff]")
+# Characters python-pptx turns into <a:br/> when setting paragraph text
+_LINE_BREAK_RE = re.compile(r"[\n\v]")
+
+
+def _runs_xml(text: str) -> str:
+    """Render text as <a:r>/<a:br/> XML the way python-pptx's paragraph text setter does.
+
+    Line feeds and vertical tabs become line breaks, control characters are
+    escaped and the few remaining XML-invalid characters are dropped, so the
+    result always parses.
+
+    Args:
+        text: Paragraph text
+
+    Returns:
+        Run XML for the inside of an <a:p> element
+    """
+    parts = []
+    for i, line in enumerate(_LINE_BREAK_RE.split(text)):
+        if i:
+            parts.append("<a:br/>")
+        if line:
+            line = _NON_XML_CHAR_RE.sub("", line)
+            line = _CTRL_CHAR_RE.sub(lambda m: "_x%04X_" % ord(m.group()), line)
+            parts.append(f"<a:r><a:t>{escape(line)}</a:t></a:r>")
+    return "".join(parts)
+
+
 class SlideBuilder:
     """Builds PowerPoint presentations using python-pptx."""
 
@@ -19,6 +59,37 @@ class SlideBuilder:
     ACCENT_COLOR = RGBColor(41, 128, 185)   # Blue accent
     BACKGROUND_COLOR = RGBColor(255, 255, 255)  # White
 
+    # Content slide geometry as (left, top, width, height) in EMU, computed once
+    _TITLE_BOX = (Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
+    _TEXT_BOX_WITH_IMAGE = (Inches(0.5), Inches(1.3), Inches(4.5), Inches(3.8))
+    _IMAGE_BOX = (Inches(5.2), Inches(1.3), Inches(4.3), Inches(3.8))
+    _TEXT_BOX_FULL = (Inches(0.5), Inches(1.3), Inches(9), Inches(3.8))
+
+    # Hex forms of the colors for the XML templates below
+    _TITLE_HEX = str(TITLE_COLOR)
+    _TEXT_HEX = str(TEXT_COLOR)
+
+    # Content slide title paragraph (32pt bold, TITLE_COLOR) and one bullet
+    # paragraph (18pt, TEXT_COLOR, space before in 1/100 pt); equivalent to
+    # setting the paragraph font/spacing properties one by one
+    _TITLE_XML = (
+        '<a:p><a:pPr><a:defRPr sz="3200" b="1"><a:solidFill><a:srgbClr val="%s"/>'
+        '</a:solidFill></a:defRPr></a:pPr>{runs}</a:p>'
+    ) % _TITLE_HEX
+    _BULLET_XML = (
+        '<a:p><a:pPr><a:spcBef><a:spcPts val="{space_before}"/></a:spcBef>'
+        '<a:defRPr sz="1800"><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:defRPr>'
+        '</a:pPr>{runs}</a:p>'
+    ) % _TEXT_HEX
+    # Wrapper so all paragraphs of a text box are parsed in one call
+    _PARAGRAPHS_XML = '<a:txBody %s>{paragraphs}</a:txBody>' % nsdecls("a")
+
+    # Threads used to read slide images from disk ahead of slide assembly
+    IMAGE_READ_WORKERS = 8
+
+    # Write buffer for save(); coalesces the many small zip member writes
+    SAVE_BUFFER_SIZE = 4 << 20
+
     def __init__(self, template_path: Optional[Path | str] = None):
         """Initialize the slide builder.
 
@@ -36,6 +107,12 @@ class SlideBuilder:
         self.prs.slide_width = Inches(10)
         self.prs.slide_height = Inches(5.625)
 
+        # Layouts used by the add_* methods, looked up once
+        layouts = self.prs.slide_layouts
+        self._title_layout = layouts[0]    # Title slide
+        self._section_layout = layouts[5]  # Title only
+        self._blank_layout = layouts[6]    # Blank
+
     def add_title_slide(self, title: str, subtitle: str = "") -> None:
         """Add a title slide to the presentation.
 
@@ -45,9 +122,7 @@ class SlideBuilder:
         """
         logger.info(f"Adding title slide: {title}")
 
-        # Use the first slide layout (typically title slide)
-        slide_layout = self.prs.slide_layouts[0]
-        slide = self.prs.slides.add_slide(slide_layout)
+        slide = self.prs.slides.add_slide(self._title_layout)
 
         # Set title
         title_shape = slide.shapes.title
@@ -69,87 +144,92 @@ class SlideBuilder:
         self,
         title: str,
         bullet_points: List[str],
-        image_path: Optional[Path | str] = None
+        image_path: Optional[Path | str | BytesIO] = None
     ) -> None:
         """Add a content slide with title, bullet points, and optional image.
 
         Args:
             title: Slide title
             bullet_points: List of bullet points
-            image_path: Optional path to image file
+            image_path: Optional path to image file, or its contents already
+                        read into memory (see _read_image)
         """
         logger.info(f"Adding content slide: {title}")
 
+        if not image_path or (isinstance(image_path, (str, Path)) and not Path(image_path).exists()):
+            image_path = None
+
         # Create blank slide
-        blank_layout = self.prs.slide_layouts[6]  # Blank layout
-        slide = self.prs.slides.add_slide(blank_layout)
+        slide = self.prs.slides.add_slide(self._blank_layout)
 
         # Add title
-        left = Inches(0.5)
-        top = Inches(0.3)
-        width = Inches(9)
-        height = Inches(0.8)
-
-        title_box = slide.shapes.add_textbox(left, top, width, height)
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-        title_frame.paragraphs[0].font.color.rgb = self.TITLE_COLOR
+        # Like text_frame.text: each line is a paragraph, only the first styled
+        title_box = slide.shapes.add_textbox(*self._TITLE_BOX)
+        first_line, *more_lines = title.split("\n")
+        self._set_paragraphs(
+            title_box.text_frame,
+            self._TITLE_XML.format(runs=_runs_xml(first_line))
+            + "".join(f"<a:p>{_runs_xml(line)}</a:p>" for line in more_lines)
+        )
 
         # Determine content area based on whether there's an image
-        if image_path and Path(image_path).exists():
+        if image_path is not None:
             # Split slide: text on left, image on right
-            content_left = Inches(0.5)
-            content_top = Inches(1.3)
-            content_width = Inches(4.5)
-            content_height = Inches(3.8)
-
-            image_left = Inches(5.2)
-            image_top = Inches(1.3)
-            image_width = Inches(4.3)
-            image_height = Inches(3.8)
+            text_box_geometry = self._TEXT_BOX_WITH_IMAGE
+            image_left, image_top, image_width, image_height = self._IMAGE_BOX
 
             # Add image
             try:
-                slide.shapes.add_picture(
-                    str(image_path),
+                picture = slide.shapes.add_picture(
+                    image_path if isinstance(image_path, BytesIO) else str(image_path),
                     image_left,
                     image_top,
                     width=image_width,
                     height=image_height
                 )
-                logger.info(f"Added image: {image_path}")
+                # python-pptx describes pictures added from a stream as
+                # "image.<ext>"; keep the file name as alt text like a path does
+                name = getattr(image_path, "name", None)
+                if isinstance(image_path, BytesIO) and name:
+                    picture._element.nvPicPr.cNvPr.set("descr", name)
+                logger.info(f"Added image to slide: {title}")
             except Exception as e:
-                logger.error(f"Failed to add image {image_path}: {e}")
+                logger.error(f"Failed to add image to slide {title}: {e}")
         else:
             # Full width for text
-            content_left = Inches(0.5)
-            content_top = Inches(1.3)
-            content_width = Inches(9)
-            content_height = Inches(3.8)
+            text_box_geometry = self._TEXT_BOX_FULL
+
+        # No bullets: leave the slide without an empty text box
+        if not bullet_points:
+            return
 
         # Add bullet points
-        text_box = slide.shapes.add_textbox(
-            content_left,
-            content_top,
-            content_width,
-            content_height
-        )
+        text_box = slide.shapes.add_textbox(*text_box_geometry)
         text_frame = text_box.text_frame
         text_frame.word_wrap = True
 
-        for i, point in enumerate(bullet_points):
-            if i == 0:
-                p = text_frame.paragraphs[0]
-            else:
-                p = text_frame.add_paragraph()
+        self._set_paragraphs(text_frame, "".join(
+            self._BULLET_XML.format(space_before=1200 if i > 0 else 0, runs=_runs_xml(point))
+            for i, point in enumerate(bullet_points)
+        ))
 
-            p.text = point
-            p.level = 0
-            p.font.size = Pt(18)
-            p.font.color.rgb = self.TEXT_COLOR
-            p.space_before = Pt(12) if i > 0 else Pt(0)
+    def _set_paragraphs(self, text_frame, paragraphs_xml: str) -> None:
+        """Replace a text frame's paragraphs with pre-rendered <a:p> XML.
+
+        All paragraphs are parsed in one go instead of building their XML one
+        property setter at a time; the frame's bodyPr (e.g. word wrap) is kept.
+        Paragraph text must be rendered with _runs_xml, which sanitizes it so
+        one bad bullet cannot make the parse (and the deck) fail.
+
+        Args:
+            text_frame: Text frame to fill
+            paragraphs_xml: Concatenated <a:p> elements
+        """
+        parsed = parse_xml(self._PARAGRAPHS_XML.format(paragraphs=paragraphs_xml))
+        tx_body = text_frame._txBody
+        for p in tx_body.p_lst:
+            tx_body.remove(p)
+        tx_body.extend(list(parsed))
 
     def add_section_slide(self, section_title: str) -> None:
         """Add a section divider slide.
@@ -160,8 +240,7 @@ class SlideBuilder:
         logger.info(f"Adding section slide: {section_title}")
 
         # Use title-only layout
-        slide_layout = self.prs.slide_layouts[5]  # Title only
-        slide = self.prs.slides.add_slide(slide_layout)
+        slide = self.prs.slides.add_slide(self._section_layout)
 
         title_shape = slide.shapes.title
         title_shape.text = section_title
@@ -190,23 +269,60 @@ class SlideBuilder:
 
         # Add content slides
         slides = content.get("slides", [])
-        if image_paths is None:
-            image_paths = [None] * len(slides)
+        images = list(image_paths or [])[:len(slides)]
+        images += [None] * (len(slides) - len(images))
+
+        # Read each distinct image file once, concurrently; slides are still
+        # added one at a time, since the Presentation object is not
+        # thread-safe. python-pptx stores identical images (by SHA-1) as a
+        # single part, so a repeated image is embedded only once.
+        unique_paths = list(dict.fromkeys(str(p) for p in images if p))
+        if unique_paths:
+            workers = min(self.IMAGE_READ_WORKERS, len(unique_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                by_path = dict(zip(unique_paths, executor.map(self._read_image, unique_paths)))
+            images = [by_path[str(p)] if p else None for p in images]
 
         for i, slide_data in enumerate(slides):
             title = slide_data.get("title", f"Slide {i+1}")
             bullet_points = slide_data.get("bullet_points", [])
-            image_path = image_paths[i] if i < len(image_paths) else None
 
-            self.add_content_slide(title, bullet_points, image_path)
+            self.add_content_slide(title, bullet_points, images[i])
 
         logger.info(f"Presentation built with {len(self.prs.slides)} slides")
 
-    def save(self, output_path: Path | str) -> Path:
+    @staticmethod
+    def _read_image(image_path: Optional[Path | str]) -> Optional[BytesIO]:
+        """Read an image file into memory.
+
+        Args:
+            image_path: Path to image file, or None
+
+        Returns:
+            In-memory image with the file name as its ``name``, or None if
+            there is no readable file
+        """
+        if not image_path:
+            return None
+        try:
+            image = BytesIO(Path(image_path).read_bytes())
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.error(f"Failed to read image {image_path}: {e}")
+            return None
+        image.name = Path(image_path).name
+        return image
+
+    def save(self, output_path: Path | str, uncached: bool = False) -> Path:
         """Save the presentation to a file.
 
         Args:
             output_path: Path to save the PPTX file
+            uncached: Keep the written file out of the OS page cache (useful
+                      for very large decks that will not be read back soon).
+                      Uses F_NOCACHE on macOS, otherwise fsync + fadvise
+                      DONTNEED after writing; a no-op where neither exists.
 
         Returns:
             Path to the saved file
@@ -214,11 +330,28 @@ class SlideBuilder:
         output_path = Path(output_path)
         ensure_directory(output_path.parent)
 
-        self.prs.save(str(output_path))
+        with open(output_path, "wb", buffering=self.SAVE_BUFFER_SIZE) as f:
+            if uncached:
+                self._disable_page_cache(f.fileno())
+            self.prs.save(f)
+            if uncached and hasattr(os, "posix_fadvise"):
+                f.flush()
+                os.fsync(f.fileno())
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
         logger.info(f"Presentation saved to {output_path}")
 
         return output_path
 
+    @staticmethod
+    def _disable_page_cache(fd: int) -> None:
+        """Turn off page caching for an open file where supported (macOS)."""
+        try:
+            import fcntl
+        except ImportError:  # Windows
+            return
+        if hasattr(fcntl, "F_NOCACHE"):
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+
     @staticmethod
     def create_presentation(
         content: Dict[str, Any],
@@ -1,12 +1,44 @@
 """AI-powered structure editor using Claude Messages API."""
 
 import os
-from typing import Dict, Any
-from anthropic import Anthropic
-from .utils import get_logger
+import json
+from functools import cached_property
+from typing import Dict, Any, Optional, Tuple
+from .utils import get_logger, log_cache_usage, get_anthropic_client, resolve_model, dumps_json, loads_json, STATIC_CACHE_CONTROL
 
 logger = get_logger(__name__)
 
+# Static editing instructions, built once so the cached prefix is the same
+# object (and bytes) on every edit; do not mutate
+_INSTRUCTIONS_BLOCK = {
+    "type": "text",
+    "text": """You are a presentation structure editor. Edit the following presentation structure based on the user's feedback.
+
+INSTRUCTIONS:
+1. Analyze the user's feedback carefully
+2. Make the requested changes to the structure
+3. Maintain the same JSON format
+4. Ensure all required fields are present (title, slides with title and bullet_points)
+5. Return ONLY the updated JSON structure, no explanations
+
+OUTPUT FORMAT:
+```json
+{
+  "title": "Presentation Title",
+  "slides": [
+    {
+      "title": "Slide Title",
+      "bullet_points": ["Point 1", "Point 2", "Point 3"],
+      "image_theme": "optional search query"
+    }
+  ]
+}
+```
+
+Return the complete updated structure.""",
+    "cache_control": STATIC_CACHE_CONTROL
+}
+
 
 class StructureEditor:
     """Edits presentation structure based on user feedback using Claude."""
@@ -22,24 +54,27 @@ class StructureEditor:
         if not self.api_key:
             raise ValueError("API key required. Set CONTENT_ANTHROPIC_API_KEY.")
 
-        self.model = model or os.getenv("CONTENT_MODEL", "claude-haiku-4-5-20251001")
+        self._model = resolve_model(model)
 
-        # Setup client with prompt caching enabled
-        base_url = os.getenv("CONTENT_ANTHROPIC_BASE_URL")
-        client_kwargs = {
-            "api_key": self.api_key,
-            "default_headers": {
-                "anthropic-beta": "prompt-caching-2024-07-31"
-            }
-        }
-        if base_url:
-            client_kwargs["base_url"] = base_url
-            logger.info(f"Using custom base URL: {base_url}")
+        self.base_url = os.getenv("CONTENT_ANTHROPIC_BASE_URL")
 
-        self.client = Anthropic(**client_kwargs)
+        # (structure, JSON text) of the last structure sent or received, so
+        # a retry or the next feedback round does not serialize it again.
+        # Structures are treated as immutable once passed in or returned.
+        self._formatted: Optional[Tuple[Dict[str, Any], str]] = None
         logger.info(f"StructureEditor initialized with model: {self.model}")
         logger.info("Prompt caching enabled for feedback loop")
 
+    @property
+    def model(self) -> str:
+        """Claude model, fixed at construction so prompt cache entries stay valid."""
+        return self._model
+
+    @cached_property
+    def client(self):
+        """Anthropic client, created on first API use (shared process-wide)."""
+        return get_anthropic_client(self.api_key, self.base_url)
+
     def edit_structure(
         self,
         current_structure: Dict[str, Any],
@@ -62,34 +97,7 @@ class StructureEditor:
         # Block 3: User feedback (fresh - changes each request)
 
         prompt_content = [
-            {
-                "type": "text",
-                "text": """You are a presentation structure editor. Edit the following presentation structure based on the user's feedback.
-
-INSTRUCTIONS:
-1. Analyze the user's feedback carefully
-2. Make the requested changes to the structure
-3. Maintain the same JSON format
-4. Ensure all required fields are present (title, slides with title and bullet_points)
-5. Return ONLY the updated JSON structure, no explanations
-
-OUTPUT FORMAT:
-```json
-{
-  "title": "Presentation Title",
-  "slides": [
-    {
-      "title": "Slide Title",
-      "bullet_points": ["Point 1", "Point 2", "Point 3"],
-      "image_theme": "optional search query"
-    }
-  ]
-}
-```
-
-Return the complete updated structure.""",
-                "cache_control": {"type": "ephemeral"}  # Cache instructions
-            },
+            _INSTRUCTIONS_BLOCK,  # Cache instructions
             {
                 "type": "text",
                 "text": f"""CURRENT STRUCTURE:
@@ -126,16 +134,12 @@ Please return the updated structure:"""
             elif response_text.startswith("```"):
                 response_text = response_text.split("```")[1].split("```")[0].strip()
 
-            # Parse JSON
-            import json
-            updated_structure = json.loads(response_text)
+            # Parse JSON; the reply text doubles as the next round's serialization
+            updated_structure = loads_json(response_text)
+            self._formatted = (updated_structure, response_text)
 
             # Log cache usage for debugging
-            usage = response.usage
-            if hasattr(usage, 'cache_creation_input_tokens') or hasattr(usage, 'cache_read_input_tokens'):
-                logger.info(f"Cache stats - Created: {getattr(usage, 'cache_creation_input_tokens', 0)} tokens, "
-                           f"Read: {getattr(usage, 'cache_read_input_tokens', 0)} tokens, "
-                           f"Regular: {getattr(usage, 'input_tokens', 0)} tokens")
+            log_cache_usage(logger, response.usage)
 
             logger.info("Structure updated successfully")
             return updated_structure
@@ -155,7 +159,11 @@ Please return the updated structure:"""
             structure: Structure dict
 
         Returns:
-            Formatted JSON string
+            Formatted JSON string (reused when structure is the same object
+            as last time)
         """
-        import json
-        return json.dumps(structure, indent=2, ensure_ascii=False)
+        if self._formatted is not None and self._formatted[0] is structure:
+            return self._formatted[1]
+        formatted = dumps_json(structure).decode("utf-8")
+        self._formatted = (structure, formatted)
+        return formatted
@@ -2,23 +2,144 @@
 
 import os
 import time
+import hashlib
+import threading
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, Any
 from soniox.speech_service import SpeechClient
 from soniox.transcribe_file import transcribe_file_short, transcribe_file_async
-from .utils import get_logger, save_json
+from .utils import get_logger, save_json, load_json, get_cache_dir
 
 logger = get_logger(__name__)
 
+# Async status polling starts at the caller's interval and backs off by this
+# factor up to the cap, so long jobs are not polled every couple of seconds
+POLL_BACKOFF = 1.5
+MAX_POLL_INTERVAL = 30.0
+
+
+class FasterWhisperTranscriber:
+    """Local transcription using faster-whisper (CTranslate2 Whisper).
+
+    Requires the optional dependency: uv sync --extra local
+    """
+
+    # Loaded models are shared across instances so the (slow) model load
+    # is paid once per process
+    _models: Dict[str, Any] = {}
+    _models_lock = threading.Lock()
+
+    def __init__(self, model_size: str | None = None, device: str | None = None):
+        """Initialize the local transcriber.
+
+        Args:
+            model_size: Whisper model size or path. If None, reads from WHISPER_MODEL
+                        env var (default: large-v3)
+            device: "cpu" or "cuda". If None, reads from WHISPER_DEVICE env var (default: cpu)
+        """
+        self.model_size = model_size or os.getenv("WHISPER_MODEL", "large-v3")
+        self.device = device or os.getenv("WHISPER_DEVICE", "cpu")
+        # int8 matmuls on CPU (VNNI/AVX2), fp16 on GPU
+        self.compute_type = "float16" if self.device == "cuda" else "int8"
+        logger.info(
+            f"FasterWhisperTranscriber initialized "
+            f"(model: {self.model_size}, device: {self.device}, compute: {self.compute_type})"
+        )
+
+    def _get_model(self):
+        """Load the Whisper model, or return the cached instance."""
+        key = f"{self.model_size}:{self.device}"
+        with self._models_lock:
+            model = self._models.get(key)
+            if model is None:
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError as e:
+                    raise ImportError(
+                        "Local transcription requires faster-whisper. "
+                        "Install it with: uv sync --extra local"
+                    ) from e
+
+                logger.info(f"Loading Whisper model: {self.model_size}")
+                model = WhisperModel(
+                    self.model_size,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    cpu_threads=os.cpu_count() or 0,  # 0 = CTranslate2 default
+                    num_workers=1  # Single audio stream per call
+                )
+                self._models[key] = model
+            return model
+
+    def transcribe(self, audio_path: Path | str) -> Dict[str, Any]:
+        """Transcribe an audio file locally.
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            Dictionary with the same keys as AudioTranscriber.transcribe()
+        """
+        audio_path = Path(audio_path)
+        file_size_mb = audio_path.stat().st_size / 1024 / 1024
+
+        logger.info(f"Starting local transcription of {audio_path.name}")
+        # Greedy decoding and VAD (skips silence) trade a little accuracy
+        # for a large speedup on long recordings
+        segments, _info = self._get_model().transcribe(
+            str(audio_path),
+            word_timestamps=True,
+            beam_size=1,
+            vad_filter=True
+        )
+
+        words = []
+        for segment in segments:
+            for word in segment.words or []:
+                words.append({
+                    "text": word.word.strip(),
+                    "start_ms": int(word.start * 1000),
+                    "duration_ms": int((word.end - word.start) * 1000),
+                })
+
+        text = ' '.join(word["text"] for word in words)
+        logger.info(f"Transcription completed. Length: {len(text)} characters")
+
+        return {
+            "audio_file": str(audio_path),
+            "text": text,
+            "model": f"faster-whisper/{self.model_size}",
+            "file_size_mb": file_size_mb,
+            "words": words,
+        }
+
+
 class AudioTranscriber:
-    """Handles audio transcription using Soniox API."""
+    """Handles audio transcription using Soniox API (or a local Whisper backend)."""
+
+    BACKENDS = ("soniox", "local")
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, backend: str | None = None):
         """Initialize the transcriber with Soniox API key.
 
         Args:
             api_key: Soniox API key. If None, reads from SONIOX_API_KEY env var.
+            backend: "soniox" (cloud, default) or "local" (faster-whisper).
+                     If None, reads from VOICE_TO_SLIDE_BACKEND env var.
         """
+        self.backend = (backend or os.getenv("VOICE_TO_SLIDE_BACKEND", "soniox")).lower()
+        if self.backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown transcription backend: {self.backend}. "
+                f"Choose one of: {', '.join(self.BACKENDS)}"
+            )
+
+        if self.backend == "local":
+            self.local = FasterWhisperTranscriber()
+            logger.info("AudioTranscriber initialized with local backend")
+            return
+
         self.api_key = api_key or os.getenv("SONIOX_API_KEY")
         if not self.api_key:
             raise ValueError("Soniox API key is required. Set SONIOX_API_KEY environment variable.")
@@ -30,14 +151,17 @@ class AudioTranscriber:
         self,
         audio_path: Path | str,
         model: str = "en_v2",
-        enable_global_speaker_diarization: bool = False
+        enable_global_speaker_diarization: bool = False,
+        use_cache: bool = False
     ) -> Dict[str, Any]:
         """Transcribe an audio file.
 
         Args:
             audio_path: Path to the audio file (MP3, WAV, M4A, etc.)
-            model: Soniox model to use (default: en_v2 for English)
-            enable_global_speaker_diarization: Enable speaker identification
+            model: Soniox model to use (default: en_v2 for English; ignored by the local backend)
+            enable_global_speaker_diarization: Enable speaker identification (Soniox only)
+            use_cache: Reuse a previous transcription of identical audio content
+                       (stored under ~/.cache/voice-to-slide/transcriptions)
 
         Returns:
             Dictionary containing transcription results with keys:
@@ -50,6 +174,59 @@ class AudioTranscriber:
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+        cache_path = None
+        if use_cache:
+            cache_path = self._cache_path(audio_path, model, enable_global_speaker_diarization)
+            if cache_path.exists():
+                try:
+                    cached = load_json(cache_path)
+                    cached["audio_file"] = str(audio_path)
+                    logger.info(f"Using cached transcription: {cache_path.name}")
+                    return cached
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable transcription cache entry {cache_path}: {e}")
+
+        transcription_data = self._transcribe(audio_path, model, enable_global_speaker_diarization)
+
+        if cache_path is not None:
+            try:
+                save_json(transcription_data, cache_path)
+            except (OSError, TypeError) as e:
+                logger.warning(f"Failed to cache transcription: {e}")
+
+        return transcription_data
+
+    def _cache_path(self, audio_path: Path, model: str, diarization: bool) -> Path:
+        """Get the cache file for a transcription, keyed by audio content and options.
+
+        Args:
+            audio_path: Path to the audio file
+            model: Soniox model name
+            diarization: Whether speaker diarization is enabled
+
+        Returns:
+            Path to the cache file (may not exist yet)
+        """
+        options = (
+            f"{self.local.model_size}:{self.local.compute_type}"
+            if self.backend == "local" else f"{model}:{diarization}"
+        )
+        digest = hashlib.blake2b(f"{self.backend}:{options}".encode("utf-8"), digest_size=16)
+        with open(audio_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return get_cache_dir("transcriptions") / f"{digest.hexdigest()}.json"
+
+    def _transcribe(
+        self,
+        audio_path: Path,
+        model: str,
+        enable_global_speaker_diarization: bool
+    ) -> Dict[str, Any]:
+        """Transcribe an audio file with the configured backend (no caching)."""
+        if self.backend == "local":
+            return self.local.transcribe(audio_path)
+
         logger.info(f"Starting transcription of {audio_path.name}")
         logger.info(f"File size: {audio_path.stat().st_size / 1024 / 1024:.2f} MB")
 
@@ -89,9 +266,17 @@ class AudioTranscriber:
                 )
                 result = self._wait_for_async_result(file_id)
 
-            # Extract the full text from result
-            if hasattr(result, 'words'):
-                text = ' '.join([word.text for word in result.words])
+            # Extract text and timings from result. Words all share one
+            # type, so the optional timing fields are checked once, not per word.
+            words = getattr(result, 'words', None)
+            if words is not None:
+                if words and hasattr(words[0], 'start_ms') and hasattr(words[0], 'duration_ms'):
+                    get_fields = attrgetter('text', 'start_ms', 'duration_ms')
+                else:
+                    def get_fields(word):
+                        return word.text, None, None
+                word_fields = list(map(get_fields, words))
+                text = ' '.join([word_text for word_text, _, _ in word_fields])
             else:
                 text = str(result)
 
@@ -105,14 +290,10 @@ class AudioTranscriber:
             }
 
             # Add word-level data if available
-            if hasattr(result, 'words'):
+            if words is not None:
                 transcription_data["words"] = [
-                    {
-                        "text": word.text,
-                        "start_ms": word.start_ms if hasattr(word, 'start_ms') else None,
-                        "duration_ms": word.duration_ms if hasattr(word, 'duration_ms') else None,
-                    }
-                    for word in result.words
+                    {"text": word_text, "start_ms": start_ms, "duration_ms": duration_ms}
+                    for word_text, start_ms, duration_ms in word_fields
                 ]
 
             # Add speaker information if available
@@ -131,7 +312,8 @@ class AudioTranscriber:
         Args:
             file_id: File ID returned from transcribe_file_async
             max_wait_seconds: Maximum time to wait for completion (default: 5 minutes)
-            poll_interval: Time between status checks in seconds (default: 2 seconds)
+            poll_interval: Initial time between status checks in seconds (default:
+                           2 seconds); grows by POLL_BACKOFF up to MAX_POLL_INTERVAL
 
         Returns:
             Transcription result object
@@ -141,7 +323,8 @@ class AudioTranscriber:
         """
         logger.info(f"Waiting for async transcription to complete (file_id: {file_id})")
         start_time = time.time()
-        
+        interval = poll_interval
+
         while True:
             # Check if we've exceeded the max wait time
             elapsed = time.time() - start_time
@@ -159,9 +342,10 @@ class AudioTranscriber:
                 error_msg = getattr(status, 'error_message', 'Unknown error')
                 raise RuntimeError(f"Async transcription failed: {error_msg}")
             
-            # Still processing, wait and try again
-            logger.debug(f"Transcription in progress... (status: {status.status}, elapsed: {elapsed:.1f}s)")
-            time.sleep(poll_interval)
+            # Still processing, wait and try again (never past the deadline)
+            logger.debug("Transcription in progress... (status: %s, elapsed: %.1fs)", status.status, elapsed)
+            time.sleep(max(0.0, min(interval, max_wait_seconds - elapsed)))
+            interval = min(interval * POLL_BACKOFF, MAX_POLL_INTERVAL)
 
     def transcribe_and_save(
         self,
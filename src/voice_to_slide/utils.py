@@ -3,9 +3,25 @@
 import os
 import json
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+# Anthropic beta features used by every client: prompt caching and the
+# 1-hour cache TTL for static prompt prefixes
+ANTHROPIC_BETA = "prompt-caching-2024-07-31,extended-cache-ttl-2025-04-11"
+STATIC_CACHE_CONTROL = {"type": "ephemeral", "ttl": "1h"}
+
+# Retries for 408/409/429/5xx/529 and connection errors. The SDK backs off
+# exponentially with jitter and honours retry-after headers.
+DEFAULT_MAX_RETRIES = 4
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,31 +47,128 @@ def get_logger(name: str) -> logging.Logger:
     
     return logger
 
+DEFAULT_MODEL = "claude-haiku-4-5-20251001"
+_first_env_model: str | None = None
+
+def resolve_model(model: str | None = None) -> str:
+    """Resolve the Claude model, defaulting to the CONTENT_MODEL env var.
+
+    Prompt cache entries are keyed by model, so if CONTENT_MODEL changes
+    within one process (or Haiku and Sonnet are mixed in one workflow) every
+    cached prefix is written twice. A warning is logged the first time the
+    environment value differs from the one seen first.
+    """
+    global _first_env_model
+    env_model = os.getenv("CONTENT_MODEL", DEFAULT_MODEL)
+    if _first_env_model is None:
+        _first_env_model = env_model
+    elif env_model != _first_env_model:
+        logging.getLogger(__name__).warning(
+            f"CONTENT_MODEL changed from {_first_env_model} to {env_model} in this process; "
+            f"prompt cache entries are per model and will not be shared"
+        )
+        _first_env_model = env_model
+    return model or env_model
+
+def log_cache_usage(logger: logging.Logger, usage: Any, label: str = "Cache stats") -> None:
+    """Log prompt-cache token counts from a Messages API usage object.
+
+    Each counter is read once; missing counters (e.g. from proxies that do
+    not report caching) are logged as 0.
+    """
+    created = getattr(usage, 'cache_creation_input_tokens', None) or 0
+    read = getattr(usage, 'cache_read_input_tokens', None) or 0
+    regular = getattr(usage, 'input_tokens', None) or 0
+    logger.info(f"{label} - Created: {created} tokens, Read: {read} tokens, Regular: {regular} tokens")
+
+@lru_cache(maxsize=4)
+def get_anthropic_client(api_key: str, base_url: str | None = None):
+    """Get a process-wide Anthropic client with prompt caching enabled.
+
+    Clients are cached per (api_key, base_url), so every orchestrator,
+    generator and editor created in a process shares one HTTP connection
+    pool and keeps its connections to the API alive between calls.
+
+    Transient failures (rate limits, overloaded, server errors) are retried
+    DEFAULT_MAX_RETRIES times, overridable with CONTENT_ANTHROPIC_MAX_RETRIES.
+    """
+    from anthropic import Anthropic
+
+    client_kwargs = {
+        "api_key": api_key,
+        "max_retries": int(os.getenv("CONTENT_ANTHROPIC_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+        "default_headers": {
+            "anthropic-beta": ANTHROPIC_BETA
+        }
+    }
+    if base_url:
+        client_kwargs["base_url"] = base_url
+        logging.getLogger(__name__).info(f"Using custom base URL: {base_url}")
+
+    return Anthropic(**client_kwargs)
+
 def ensure_directory(path: Path | str) -> Path:
     """Ensure a directory exists, creating it if necessary."""
     path = Path(path)
     path.mkdir(parents=True, exist_ok=True)
     return path
 
+def get_cache_dir(name: str) -> Path:
+    """Get a per-user cache directory for the given namespace, creating it if necessary.
+
+    The base directory defaults to ~/.cache/voice-to-slide and can be
+    overridden with the VOICE_TO_SLIDE_CACHE_DIR environment variable.
+    """
+    base = os.getenv("VOICE_TO_SLIDE_CACHE_DIR") or Path.home() / ".cache" / "voice-to-slide"
+    return ensure_directory(Path(base).expanduser() / name)
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: accept int/float/etc. keys like json.dumps does
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def loads_json(data: str | bytes) -> Any:
+    """Parse JSON text (orjson when available).
+
+    Raises json.JSONDecodeError on invalid input (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def save_json(data: Dict[str, Any], filepath: Path | str) -> None:
-    """Save data to a JSON file."""
+    """Save data to a JSON file.
+
+    The data is written to a temporary file in the same directory and moved
+    into place, so readers (e.g. concurrent workers sharing a cache) never
+    see a partially written file.
+    """
     filepath = Path(filepath)
     ensure_directory(filepath.parent)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    payload = dumps_json(data)
+
+    # Unique per process and thread so concurrent writers never share a temp file
+    tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 def load_json(filepath: Path | str) -> Dict[str, Any]:
     """Load data from a JSON file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return loads_json(f.read())
+
+# Drops characters invalid in filenames and turns spaces into underscores
+_FILENAME_TABLE = str.maketrans({**dict.fromkeys('<>:"/\\|?*'), ' ': '_'})
 
+@lru_cache(maxsize=256)
 def sanitize_filename(filename: str) -> str:
     """Sanitize a string to be used as a filename."""
-    # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '')
-    # Replace spaces with underscores
-    filename = filename.replace(' ', '_')
-    # Limit length
-    return filename[:100]
+    # Single translate pass, then limit length
+    return filename.translate(_FILENAME_TABLE)[:100]